@@ -8,12 +8,51 @@ CRITICAL RULE: This service MUST be called by ALL agents before executing ANY ta
 """
 
 import os
+import time
 import requests
 from typing import Dict, Any, Optional
 from datetime import datetime
 import json
 
 
+class _Breaker:
+    """
+    Minimal circuit breaker for an external dependency (GitLab, Jira).
+    
+    After `fail_threshold` consecutive failures the breaker opens and calls are
+    short-circuited for `reset_after` seconds. Once that period elapses a single
+    trial call is allowed through; success closes the breaker, failure re-opens it.
+    """
+    
+    def __init__(self, fail_threshold: int = 5, reset_after: float = 60.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self.fail_count = 0
+        self.opened_at: Optional[float] = None
+    
+    def allow(self) -> bool:
+        """Return True if a call may be attempted."""
+        if self.opened_at is None:
+            return True
+        if time.monotonic() - self.opened_at >= self.reset_after:
+            # Half-open: let one trial call through
+            self.opened_at = None
+            self.fail_count = self.fail_threshold - 1
+            return True
+        return False
+    
+    def record_success(self):
+        """Reset failure tracking after a successful call."""
+        self.fail_count = 0
+        self.opened_at = None
+    
+    def record_failure(self):
+        """Count a failed call and open the breaker when the threshold is hit."""
+        self.fail_count += 1
+        if self.fail_count >= self.fail_threshold:
+            self.opened_at = time.monotonic()
+
+
 class IntegrationService:
     """
     Service for updating GitLab and Jira before task execution.
@@ -74,6 +113,18 @@ class IntegrationService:
         self.gitlab_enabled = self.config.get('enable_gitlab', True)
         self.jira_enabled = self.config.get('enable_jira', True)
         
+        # Request timeouts as a (connect, read) pair so unreachable hosts fail
+        # fast instead of holding the agent for the whole read budget
+        self._timeout = (
+            float(self.config.get('connect_timeout') or os.getenv('INTEGRATION_CONNECT_TIMEOUT') or 2.0),
+            float(self.config.get('read_timeout') or os.getenv('INTEGRATION_READ_TIMEOUT') or 8.0)
+        )
+        
+        # Circuit breakers - stop paying the full timeout on every task while
+        # GitLab or Jira is unreachable
+        self._gitlab_breaker = _Breaker(fail_threshold=5, reset_after=60.0)
+        self._jira_breaker = _Breaker(fail_threshold=5, reset_after=60.0)
+        
         # Validate configuration
         self._validate_config()
     
@@ -183,25 +234,46 @@ class IntegrationService:
                 'message': 'GitLab not configured (missing URL or token)'
             }
         
+        if not self.gitlab_project_id:
+            return {
+                'success': False,
+                'message': 'GitLab project ID not configured'
+            }
+        
+        if not self._gitlab_breaker.allow():
+            return {'success': False, 'message': 'circuit open'}
+        
         try:
             # Try to update pipeline if pipeline_id is available
-            if self.gitlab_pipeline_id and self.gitlab_project_id:
-                return self._update_gitlab_pipeline(task_description, task_type, metadata)
+            if self.gitlab_pipeline_id:
+                result = self._update_gitlab_pipeline(task_description, task_type, metadata)
             # Otherwise, create a project note or issue
-            elif self.gitlab_project_id:
-                return self._create_gitlab_note(task_description, task_type, metadata)
             else:
-                return {
-                    'success': False,
-                    'message': 'GitLab project ID not configured'
-                }
+                result = self._create_gitlab_note(task_description, task_type, metadata)
+            self._record_outcome(self._gitlab_breaker, result)
+            return result
         except Exception as e:
+            self._gitlab_breaker.record_failure()
             return {
                 'success': False,
                 'error': str(e),
                 'message': f'GitLab update error: {str(e)}'
             }
     
+    @staticmethod
+    def _record_outcome(breaker: _Breaker, result: Dict[str, Any]):
+        """
+        Feed a call result into a circuit breaker.
+        
+        Results carrying an 'error' key come from a request exception (timeout,
+        connection refused, ...) and count as failures. Any HTTP response, even a
+        non-2xx one, means the service is reachable.
+        """
+        if result.get('success') or 'error' not in result:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+    
     def _update_gitlab_pipeline(
         self, 
         task_description: str, 
@@ -235,7 +307,7 @@ class IntegrationService:
         }
         
         try:
-            response = requests.post(note_url, headers=headers, json=payload, timeout=10)
+            response = requests.post(note_url, headers=headers, json=payload, timeout=self._timeout)
             if response.status_code in [200, 201]:
                 print(f"IntegrationService: ✓ GitLab pipeline updated successfully")
                 return {
@@ -286,7 +358,7 @@ class IntegrationService:
         }
         
         try:
-            response = requests.post(issue_url, headers=headers, json=payload, timeout=10)
+            response = requests.post(issue_url, headers=headers, json=payload, timeout=self._timeout)
             if response.status_code in [200, 201]:
                 issue_data = response.json()
                 print(f"IntegrationService: ✓ GitLab issue created: {issue_data.get('iid', 'N/A')}")
@@ -342,24 +414,31 @@ class IntegrationService:
                 'message': 'Jira not configured (missing URL, email, or API token)'
             }
         
+        # Try to find and update existing ticket from metadata
+        ticket_key = None
+        if metadata:
+            ticket_key = metadata.get('jira_ticket') or metadata.get('ticket_key')
+        
+        if not ticket_key and not self.jira_project_key:
+            return {
+                'success': False,
+                'message': 'Jira project key not configured and no ticket key provided'
+            }
+        
+        if not self._jira_breaker.allow():
+            return {'success': False, 'message': 'circuit open'}
+        
         try:
-            # Try to find and update existing ticket from metadata
-            ticket_key = None
-            if metadata:
-                ticket_key = metadata.get('jira_ticket') or metadata.get('ticket_key')
-            
             # If ticket key is provided, add comment
             if ticket_key:
-                return self._add_jira_comment(ticket_key, task_description, task_type, metadata)
+                result = self._add_jira_comment(ticket_key, task_description, task_type, metadata)
             # Otherwise, create a new ticket
-            elif self.jira_project_key:
-                return self._create_jira_ticket(task_description, task_type, metadata)
             else:
-                return {
-                    'success': False,
-                    'message': 'Jira project key not configured and no ticket key provided'
-                }
+                result = self._create_jira_ticket(task_description, task_type, metadata)
+            self._record_outcome(self._jira_breaker, result)
+            return result
         except Exception as e:
+            self._jira_breaker.record_failure()
             return {
                 'success': False,
                 'error': str(e),
@@ -415,7 +494,7 @@ class IntegrationService:
         }
         
         try:
-            response = requests.post(comment_url, headers=headers, json=comment_body, timeout=10)
+            response = requests.post(comment_url, headers=headers, json=comment_body, timeout=self._timeout)
             if response.status_code in [200, 201]:
                 print(f"IntegrationService: ✓ Jira comment added to {ticket_key}")
                 return {
@@ -510,7 +589,7 @@ class IntegrationService:
         }
         
         try:
-            response = requests.post(issue_url, headers=headers, json=issue_body, timeout=10)
+            response = requests.post(issue_url, headers=headers, json=issue_body, timeout=self._timeout)
             if response.status_code in [200, 201]:
                 issue_data = response.json()
                 ticket_key = issue_data.get('key')
@@ -37,9 +37,21 @@ OUTPUT:
 import json
 import os
 import re
+import sys
+import time
+import asyncio
+import functools
+import logging
+import mmap
+import sqlite3
+import hashlib
+import itertools
+import threading
+import traceback
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Set, Tuple
-from collections import defaultdict
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Import reporting service
 try:
@@ -48,6 +60,506 @@ try:
 except ImportError:
     REPORTING_SERVICE_AVAILABLE = False
 
+# Optional faster JSON parser for large export files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# answer_question debug trace; off unless PHOENIX_DEBUG is set (and never under python -O)
+DEBUG_ENABLED = __debug__ and bool(os.environ.get('PHOENIX_DEBUG'))
+
+# Debug trace file (project root/.cursor/debug.log unless PHOENIX_DEBUG_LOG is set)
+DEBUG_LOG_PATH = Path(os.environ.get('PHOENIX_DEBUG_LOG') or Path(__file__).parent.parent.parent / ".cursor" / "debug.log")
+
+# Debug trace records are appended through one buffer of this size per process
+DEBUG_LOG_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    Binary-append FileHandler that keeps its file open and leaves flushing to the buffer.
+    
+    Records reach the disk when the buffer fills and at exit (logging.shutdown()
+    flushes and closes handlers), instead of with one write per record. A record
+    whose message is bytes is written as-is and must end with a newline; other
+    records are formatted and UTF-8 encoded.
+    """
+    
+    def __init__(self, filename: Path):
+        super().__init__(filename, mode='ab', delay=True)
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=DEBUG_LOG_BUFFER_SIZE)
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            if isinstance(record.msg, bytes):
+                self.stream.write(record.msg)
+            else:
+                self.stream.write((self.format(record) + self.terminator).encode('utf-8'))
+        except Exception:
+            self.handleError(record)
+
+
+_DEBUG_LOGGER = logging.getLogger('phoenix_expert.debug')
+_DEBUG_LOGGER.propagate = False
+# Handlers live on the shared logger, so a reloaded module must not attach a second one
+if DEBUG_ENABLED and not _DEBUG_LOGGER.handlers:
+    try:
+        DEBUG_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _debug_file_handler = _BufferedFileHandler(DEBUG_LOG_PATH)
+        _debug_file_handler.setFormatter(logging.Formatter('%(message)s'))
+        _DEBUG_LOGGER.addHandler(_debug_file_handler)
+    except OSError as e:
+        print(f"PhoenixExpert: ⚠ Debug log disabled, cannot use {DEBUG_LOG_PATH}: {e}")
+        DEBUG_ENABLED = False
+# Explicit level so the trace never follows the root logger's level (records
+# built by other modules sharing this logger are skipped unless tracing is on)
+_DEBUG_LOGGER.setLevel(logging.DEBUG if DEBUG_ENABLED else logging.CRITICAL + 1)
+
+
+@functools.lru_cache(maxsize=None)
+def _debug_record_prefix(entry_id: str, location: str, message: str, run_id: str, hypothesis_id: str) -> str:
+    """Serialize the fixed fields of a trace point once, up to where the timestamp value goes."""
+    fixed = json.dumps({
+        'id': entry_id,
+        'location': location,
+        'message': message,
+        'sessionId': 'debug-session',
+        'runId': run_id,
+        'hypothesisId': hypothesis_id
+    }, separators=(',', ':'))
+    return fixed[:-1] + ',"timestamp":'
+
+
+def _debug_log(entry_id: str, location: str, message: str, data: Dict[str, Any],
+               run_id: str, hypothesis_id: str):
+    """
+    Append one JSON record to the debug trace.
+    
+    Callers check DEBUG_ENABLED first so the payload is never built when tracing is off.
+    """
+    if ORJSON_AVAILABLE:
+        # orjson encodes the whole record faster than the fixed-prefix splice below,
+        # and its bytes go to the binary log file without another encoding pass
+        _DEBUG_LOGGER.debug(orjson.dumps({
+            'id': entry_id,
+            'location': location,
+            'message': message,
+            'sessionId': 'debug-session',
+            'runId': run_id,
+            'hypothesisId': hypothesis_id,
+            'timestamp': time.time() * 1000,
+            'data': data
+        }, option=orjson.OPT_APPEND_NEWLINE))
+        return
+    
+    # json.dumps is slow enough that serializing only the timestamp and data pays off
+    prefix = _debug_record_prefix(entry_id, location, message, run_id, hypothesis_id)
+    data_json = json.dumps(data, separators=(',', ':'))
+    _DEBUG_LOGGER.debug(f'{prefix}{time.time() * 1000!r},"data":{data_json}}}')
+
+
+# Parsed-file cache location (project root/.cache)
+PARSE_CACHE_PATH = Path(__file__).parent.parent.parent / ".cache" / "phoenix_parse_cache.sqlite"
+
+# Bump when parsing rules change so stale cache rows are discarded
+PARSE_CACHE_VERSION = 2
+
+# Below this many files to parse, worker process start-up costs more than it saves
+PARALLEL_PARSE_MIN_FILES = 200
+
+# Maximum number of Java sources kept in memory for search_codebase
+FILE_TEXT_CACHE_SIZE = 2000
+
+# Read size for streaming searches over files that don't fit in the text cache
+SCAN_CHUNK_SIZE = 64 * 1024
+
+# Threads scanning files in codebase searches; stat() and cold reads release the GIL
+SEARCH_THREADS = 4
+
+# Question words shorter than this are too common to be useful codebase search keywords
+MIN_KEYWORD_LENGTH = 4
+
+# Pages fetched by batch_fetch_confluence; answer_question keeps at most 10 Confluence sources
+CONFLUENCE_BATCH_MAX_PAGES = 10
+
+# Confluence results are reused for repeated questions within this many seconds
+CONFLUENCE_CACHE_TTL = 300
+CONFLUENCE_CACHE_SIZE = 128
+
+_WORD_RE = re.compile(r'\w+')
+
+# Shared by all PhoenixExpert instances; threads are started on first use
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=SEARCH_THREADS, thread_name_prefix='PhoenixExpertSearch')
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_MIN_FILE_SIZE = 256 * 1024
+
+# Java sources are parsed as bytes; only matched groups are decoded
+_PACKAGE_RE = re.compile(rb'package\s+([\w.]+);')
+# Optional 'public'/'abstract' modifiers never change which name is captured, and
+# leaving them out lets the regex engine skip ahead to the keyword
+_CLASS_RE = re.compile(rb'(?:class|interface|enum)\s+(\w+)')
+_IMPORT_RE = re.compile(rb'import\s+([\w.]+);')
+_INTERFACE_RE = re.compile(rb'interface', re.IGNORECASE)
+
+
+def _class_markers(content: bytes) -> Tuple[bool, bool]:
+    """
+    Check Java source for controller annotations and Spring Data repository supertypes.
+    
+    Both type detection and categorization need these, so they are scanned for once.
+    
+    Returns:
+        (has controller annotation, extends a Spring Data repository) tuple
+    """
+    is_controller = content.find(b'@RestController') != -1 or content.find(b'@Controller') != -1
+    is_repository = content.find(b'extends JpaRepository') != -1 or content.find(b'extends CrudRepository') != -1
+    return is_controller, is_repository
+
+
+def _detect_class_type(head: str, content: bytes, is_controller: bool, is_repository: bool) -> str:
+    """
+    Detect the type of Java class.
+    
+    Args:
+        head: First 500 characters of the source
+        content: Full source as bytes (or a memory map)
+        is_controller: Whether the source has a controller annotation (see _class_markers)
+        is_repository: Whether the source extends a Spring Data repository (see _class_markers)
+    """
+    if 'interface' in head:
+        return 'interface'
+    elif 'enum' in head:
+        return 'enum'
+    elif is_controller:
+        return 'controller'
+    elif is_repository:
+        return 'repository'
+    elif content.find(b'@Service') != -1:
+        return 'service'
+    elif content.find(b'@Entity') != -1:
+        return 'entity'
+    elif 'abstract' in head:
+        return 'abstract_class'
+    else:
+        return 'class'
+
+
+def _parse_java_content(content: bytes) -> Dict[str, Any]:
+    """
+    Extract package, class name, type, category and Phoenix imports from Java source.
+    
+    Args:
+        content: Java file content as bytes (or a memory map)
+    
+    Returns:
+        Dictionary with 'package', 'class_name', 'type', 'category' (one of the
+        _codebase_cache category keys or None) and 'imports'. 'package' and
+        'class_name' are None when not found.
+    """
+    parsed = {'package': None, 'class_name': None, 'type': None, 'category': None, 'imports': []}
+    
+    package_match = _PACKAGE_RE.search(content)
+    if not package_match:
+        return parsed
+    package = package_match.group(1).decode('ascii')
+    parsed['package'] = package
+    
+    class_match = _CLASS_RE.search(content)
+    if not class_match:
+        return parsed
+    class_name = class_match.group(1).decode('ascii')
+    parsed['class_name'] = class_name
+    
+    # 500 characters span at most 2000 UTF-8 bytes
+    head = content[:2000].decode('utf-8', errors='ignore').replace('\r\n', '\n')[:500]
+    is_controller, is_repository = _class_markers(content)
+    parsed['type'] = _detect_class_type(head, content, is_controller, is_repository)
+    
+    # Categorize by type ('interface' in the header already answers the case-insensitive check)
+    package_lower = package.lower()
+    if 'Controller' in class_name or is_controller:
+        parsed['category'] = 'controllers'
+    elif 'Service' in class_name and 'interface' not in head and not _INTERFACE_RE.search(content):
+        parsed['category'] = 'services'
+    elif 'Repository' in class_name or is_repository:
+        parsed['category'] = 'repositories'
+    elif 'model' in package_lower or 'entity' in package_lower or content.find(b'@Entity') != -1:
+        parsed['category'] = 'models'
+    
+    # Extract dependencies (imports)
+    imports = [imp.decode('ascii') for imp in _IMPORT_RE.findall(content)]
+    parsed['imports'] = [imp for imp in imports if 'phoenix' in imp.lower() or 'bg.energo' in imp.lower()]
+    return parsed
+
+
+def _digest_and_parse(
+    content: bytes,
+    known_digest: Optional[bytes]
+) -> Tuple[bytes, Optional[Dict[str, Any]]]:
+    """Hash Java source and parse it unless the hash matches known_digest."""
+    digest = hashlib.sha256(content).digest()
+    if digest == known_digest:
+        return digest, None
+    return digest, _parse_java_content(content)
+
+
+def _parse_java_file(
+    path: str,
+    known_digest: Optional[bytes] = None
+) -> Optional[Tuple[int, int, bytes, Optional[Dict[str, Any]]]]:
+    """
+    Read, hash and parse a single Java file.
+    
+    Pure function so it can run in worker processes.
+    
+    Args:
+        path: Absolute path to the Java file
+        known_digest: SHA-256 of the cached parse result for this path, if any
+    
+    Returns:
+        (mtime_ns, size, sha256, parsed) tuple - parsed is None when the content
+        still matches known_digest - or None if the file can't be read
+    """
+    try:
+        st = os.stat(path)
+        with open(path, 'rb') as f:
+            if st.st_size < MMAP_MIN_FILE_SIZE:
+                digest, parsed = _digest_and_parse(f.read(), known_digest)
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    digest, parsed = _digest_and_parse(content, known_digest)
+    except (OSError, ValueError):
+        return None
+    return st.st_mtime_ns, st.st_size, digest, parsed
+
+
+def _question_keywords(question: str) -> List[str]:
+    """Extract distinct lowercase search keywords from a question, in order of appearance."""
+    return list(dict.fromkeys(
+        word for word in _WORD_RE.findall(question.lower()) if len(word) >= MIN_KEYWORD_LENGTH
+    ))
+
+
+def _trigram_candidates(trigrams: Dict[str, Set[int]], text_lower: str, count: int) -> List[int]:
+    """
+    Get ordinals (ascending) of indexed strings that may contain text_lower.
+    
+    Args:
+        trigrams: Trigram -> ordinals of the indexed strings containing it
+        text_lower: Lowercased search text
+        count: Number of indexed strings; text too short to have a trigram matches all of them
+    """
+    if len(text_lower) < 3:
+        return list(range(count))
+    
+    postings = []
+    for trigram in {text_lower[i:i + 3] for i in range(len(text_lower) - 2)}:
+        ordinals = trigrams.get(trigram)
+        if not ordinals:
+            return []
+        postings.append(ordinals)
+    postings.sort(key=len)
+    return sorted(postings[0].intersection(*postings[1:]))
+
+
+def _find_java_files(root: str) -> List[str]:
+    """
+    Recursively list .java files under a directory as plain path strings.
+    
+    Uses os.scandir directly instead of Path.rglob so no Path object is created
+    per directory entry. Files are returned in the same order as rglob: each
+    directory's own files, then its subdirectories depth-first; symlinked
+    directories are not followed.
+    
+    Args:
+        root: Directory to search
+    
+    Returns:
+        List of .java file paths
+    """
+    java_files = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.java'):
+                        java_files.append(entry.path)
+                    try:
+                        if entry.is_dir() and not entry.is_symlink():
+                            subdirectories.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+        pending.extend(reversed(subdirectories))
+    return java_files
+
+
+def _stream_contains(path: str, term_lower: str) -> bool:
+    """
+    Case-insensitive substring test that reads a file in chunks and stops at the first match.
+    
+    Args:
+        path: Path to the Java file
+        term_lower: Lowercased search term
+    
+    Returns:
+        True if the file contains the term, False otherwise or if it can't be read
+    """
+    # Carry the end of the previous chunk so matches spanning chunks are found
+    overlap = len(term_lower) - 1
+    tail = ''
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            while True:
+                chunk = f.read(SCAN_CHUNK_SIZE)
+                text = tail + chunk.lower()
+                if term_lower in text:
+                    return True
+                if not chunk:
+                    return False
+                tail = text[-overlap:] if overlap > 0 else ''
+    except Exception:
+        return False
+
+
+class TTLCache(OrderedDict):
+    """
+    Size-bounded LRU mapping whose entries expire ttl seconds after being stored.
+    
+    Entries are stored as (timestamp, value); use put() and get_fresh() rather than item access.
+    """
+    
+    def __init__(self, maxsize: int = 128, ttl: float = 300):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+    
+    def put(self, key: Any, value: Any):
+        """Store value under key, evicting the least recently used entries beyond maxsize."""
+        self[key] = (time.monotonic(), value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            self.popitem(last=False)
+    
+    def get_fresh(self, key: Any) -> Any:
+        """Return the value stored under key, or None if missing or expired."""
+        entry = super().get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] < self.ttl:
+            self.move_to_end(key)
+            return entry[1]
+        del self[key]
+        return None
+
+
+def _normalize_question(question: str) -> str:
+    """Case- and whitespace-insensitive key for caching per-question results."""
+    return ' '.join(question.lower().split())
+
+
+def _confluence_results(result: Any) -> List[Dict[str, Any]]:
+    """Normalize an MCP Confluence tool result (list or {'results': [...]}) to a list of dicts."""
+    if isinstance(result, dict):
+        result = result.get('results', [])
+    if not isinstance(result, list):
+        return []
+    return [item for item in result if isinstance(item, dict)]
+
+
+def _load_parse_cache(cache_path: Path) -> Optional[sqlite3.Connection]:
+    """
+    Open (creating if needed) the SQLite cache of parsed Java files.
+    
+    Rows are keyed by file path and validated by size/mtime first, then by
+    the SHA-256 of the content, so unchanged files are never re-parsed.
+    
+    Returns:
+        Open connection, or None if the cache cannot be used
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(cache_path))
+        if conn.execute('PRAGMA user_version').fetchone()[0] != PARSE_CACHE_VERSION:
+            conn.execute('DROP TABLE IF EXISTS parse_cache')
+            conn.execute(f'PRAGMA user_version = {PARSE_CACHE_VERSION}')
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS parse_cache ('
+            'path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, sha256 BLOB, '
+            'package TEXT, class_name TEXT, type TEXT, category TEXT, imports TEXT)'
+        )
+        conn.commit()
+        return conn
+    except (OSError, sqlite3.Error) as e:
+        print(f"PhoenixExpert: ⚠ Parse cache unavailable, parsing all files: {str(e)}")
+        return None
+
+
+# MCP tools listed by search_confluence_mcp
+_CONFLUENCE_SEARCH_MCP_TOOLS = (
+    'mcp_Confluence_search',
+    'mcp_Confluence_getConfluenceSpaces',
+    'mcp_Confluence_getPagesInConfluenceSpace',
+    'mcp_Confluence_getConfluencePage'
+)
+
+# Confluence MCP workflow returned by get_mcp_confluence_workflow; shared, so treat as read-only
+_MCP_CONFLUENCE_WORKFLOW_STEPS = (
+    {
+        'step': 1,
+        'action': 'Get Confluence cloud ID',
+        'mcp_tool': 'mcp_Confluence_getAccessibleAtlassianResources',
+        'description': 'Get accessible Atlassian resources to obtain cloudId'
+    },
+    {
+        'step': 2,
+        'action': 'Search Confluence',
+        'mcp_tool': 'mcp_Confluence_search',
+        'parameters': {'query': '<question>'},
+        'description': 'Search across all Confluence content for the question'
+    },
+    {
+        'step': 3,
+        'action': 'Get Confluence spaces',
+        'mcp_tool': 'mcp_Confluence_getConfluenceSpaces',
+        'parameters': {'cloudId': '<from step 1>'},
+        'description': 'Get all accessible Confluence spaces'
+    },
+    {
+        'step': 4,
+        'action': 'Search pages in spaces',
+        'mcp_tool': 'mcp_Confluence_getPagesInConfluenceSpace',
+        'parameters': {'cloudId': '<from step 1>', 'spaceId': '<from step 3>', 'title': '<question>'},
+        'description': 'Search for pages matching the question in each space'
+    },
+    {
+        'step': 5,
+        'action': 'Get page content',
+        'mcp_tool': 'mcp_Confluence_getConfluencePage',
+        'parameters': {'cloudId': '<from step 1>', 'pageId': '<from step 4>'},
+        'description': 'Get full content of relevant pages'
+    },
+    {
+        'step': 6,
+        'action': 'Call PhoenixExpert',
+        'method': 'answer_question',
+        'parameters': {'question': '<question>', 'confluence_data': '<results from steps 2-5>'},
+        'description': 'Call PhoenixExpert with question and Confluence data'
+    }
+)
+
 
 class PhoenixExpert:
     """
@@ -78,54 +590,125 @@ class PhoenixExpert:
             'phoenix-payment-api': phoenix_base_path / "phoenix-payment-api"
         }
         
-        self.architecture_data = None
+        self._export_file_path = export_file_path
+        self._architecture_data = None
         self.confluence_cache_path = Path(__file__).parent.parent / "confluence_cache"
         self.use_mcp_confluence = True  # Always use MCP Confluence for fresh data
         self.confluence_cloud_id = None  # Will be set when accessing Confluence
+        self._confluence_spaces: Optional[List[Dict[str, Any]]] = None  # Fetched once per instance
+        # normalized question -> Confluence results (see cache_confluence_result)
+        self._confluence_cache = TTLCache(maxsize=CONFLUENCE_CACHE_SIZE, ttl=CONFLUENCE_CACHE_TTL)
         
-        # Codebase analysis cache with project-specific data
-        self._codebase_cache = {
-            'classes': {},
-            'packages': set(),
-            'controllers': {},
-            'services': {},
-            'repositories': {},
-            'models': {},
-            'dependencies': defaultdict(set),
-            'projects': {}  # Store project-specific statistics
-        }
+        # Codebase analysis cache, filled on first access (see _codebase_cache)
+        self._codebase_data: Optional[Dict[str, Any]] = None
+        self._codebase_loaded = False
+        # Reentrant: the loaders read _codebase_cache while filling it
+        self._codebase_lock = threading.RLock()
         
-        # Try to load from exported file first
-        if export_file_path:
-            self._load_from_export(export_file_path)
-        else:
-            # Try default export file location
-            default_export = Path(__file__).parent.parent / "phoenix_export.json"
-            if default_export.exists():
-                print("PhoenixExpert: Found exported JSON file, loading from it...")
-                self._load_from_export(default_export)
-            else:
-                # Fall back to analyzing codebase directly
-                self._load_architecture()
-                self._analyze_all_phoenix_projects()
+        # Open only while analyzing projects (see _analyze_all_phoenix_projects)
+        self._parse_cache: Optional[sqlite3.Connection] = None
         
-        # Initialize reporting service
-        self.reporting_service = None
-        if REPORTING_SERVICE_AVAILABLE:
-            try:
-                self.reporting_service = get_reporting_service()
-            except Exception as e:
-                print(f"PhoenixExpert: Failed to initialize reporting service: {str(e)}")
+        # path -> (mtime_ns, size, lowercased content) for search_codebase
+        self._file_text_cache: Dict[str, Tuple[int, int, str]] = {}
+        
+        # Lookup index over _codebase_cache['classes'], extended lazily (see _ensure_class_index).
+        # Parallel lists indexed by ordinal (insertion order): class info and its lowercased fields
+        self._class_infos: List[Dict[str, Any]] = []
+        self._class_names_lower: List[str] = []
+        self._class_full_names_lower: List[str] = []
+        self._class_packages_lower: List[str] = []
+        self._class_types_lower: List[str] = []
+        # exact class name / full name -> first matching ordinal
+        self._class_exact: Dict[str, int] = {}
+        # trigram of any lowercased field -> ordinals
+        self._class_trigrams: Dict[str, Set[int]] = defaultdict(set)
+        # category -> trigram index over its lowercased keys (see _category_matches)
+        self._category_indexes: Dict[str, Dict[str, Any]] = {}
+        
+        # Reporting service is looked up on first use (see reporting_service)
+        self._reporting_service = None
+        self._reporting_service_resolved = False
         
         print("PhoenixExpert: Initialized in READ-ONLY mode")
         print("PhoenixExpert: Ready to answer questions about Phoenix project")
     
+    @property
+    def _codebase_cache(self) -> Dict[str, Any]:
+        """Codebase analysis cache; loaded from the export or the Phoenix sources on first access."""
+        if not self._codebase_loaded:
+            self._load_codebase()
+        return self._codebase_data
+    
+    @property
+    def architecture_data(self) -> Optional[Dict[str, Any]]:
+        """Architecture data; read alongside the codebase when analyzing sources directly."""
+        if not self._codebase_loaded:
+            self._load_codebase()
+        return self._architecture_data
+    
+    @property
+    def reporting_service(self):
+        """Reporting service, or None if unavailable; resolved on first use."""
+        if not self._reporting_service_resolved:
+            self._reporting_service_resolved = True
+            if REPORTING_SERVICE_AVAILABLE:
+                try:
+                    self._reporting_service = get_reporting_service()
+                except Exception as e:
+                    print(f"PhoenixExpert: Failed to initialize reporting service: {str(e)}")
+        return self._reporting_service
+    
+    @reporting_service.setter
+    def reporting_service(self, service):
+        self._reporting_service = service
+        self._reporting_service_resolved = True
+    
+    def _load_codebase(self):
+        """Fill the codebase cache from the export file, or by analyzing the Phoenix projects."""
+        with self._codebase_lock:
+            # Loaded by another thread meanwhile, or already being loaded by this one
+            if self._codebase_loaded or self._codebase_data is not None:
+                return
+            
+            self._codebase_data = {
+                'classes': {},
+                'packages': set(),
+                'controllers': {},
+                'services': {},
+                'repositories': {},
+                'models': {},
+                'dependencies': defaultdict(set),
+                'projects': {}  # Store project-specific statistics
+            }
+            try:
+                # Try to load from exported file first
+                if self._export_file_path:
+                    self._load_from_export(self._export_file_path)
+                else:
+                    # Try default export file location
+                    default_export = Path(__file__).parent.parent / "phoenix_export.json"
+                    if default_export.exists():
+                        print("PhoenixExpert: Found exported JSON file, loading from it...")
+                        self._load_from_export(default_export)
+                    else:
+                        # Fall back to analyzing codebase directly
+                        self._load_architecture()
+                        self._analyze_all_phoenix_projects()
+            except BaseException:
+                # Start over on the next access rather than serving a partial cache
+                self._codebase_data = None
+                raise
+            self._codebase_loaded = True
+    
     def _load_from_export(self, export_file_path: Path):
         """Load codebase data from exported JSON file."""
         try:
             print(f"PhoenixExpert: Loading from export file: {export_file_path}")
-            with open(export_file_path, 'r', encoding='utf-8') as f:
-                export_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                export_data = orjson.loads(Path(export_file_path).read_bytes())
+            else:
+                with open(export_file_path, 'r', encoding='utf-8') as f:
+                    export_data = json.load(f)
             
             # Load statistics
             stats = export_data.get('statistics', {})
@@ -175,7 +758,7 @@ class PhoenixExpert:
         if arch_file.exists():
             try:
                 with open(arch_file, 'r', encoding='utf-8') as f:
-                    self.architecture_data = json.load(f)
+                    self._architecture_data = json.load(f)
                 print(f"PhoenixExpert: Loaded architecture data")
             except Exception as e:
                 print(f"PhoenixExpert: Could not load architecture data - {str(e)}")
@@ -186,6 +769,8 @@ class PhoenixExpert:
         READ-ONLY operation.
         """
         # Try export data first
+        if not self._codebase_loaded:
+            self._load_codebase()
         if hasattr(self, '_export_data'):
             files_data = self._export_data.get('files', {})
             if file_path in files_data:
@@ -213,20 +798,40 @@ class PhoenixExpert:
         total_java_files = 0
         total_classes = 0
         
-        for project_name, project_path in self.phoenix_projects.items():
-            if not project_path.exists():
-                print(f"PhoenixExpert: Project {project_name} not found, skipping...")
-                continue
-            
-            print(f"\nPhoenixExpert: Analyzing {project_name}...")
-            project_stats = self._analyze_project(project_path, project_name)
+        self._parse_cache = _load_parse_cache(PARSE_CACHE_PATH)
+        try:
+            # Collect files from every project first so parsing fans out across all of them
+            project_files = {
+                project_name: self._collect_java_files(project_path)
+                for project_name, project_path in self.phoenix_projects.items()
+                if project_path.exists()
+            }
+            parsed_files = self._parse_java_files(
+                [path for paths in project_files.values() for path in paths]
+            )
             
-            if project_stats:
-                self._codebase_cache['projects'][project_name] = project_stats
-                total_java_files += project_stats.get('java_files', 0)
-                total_classes += project_stats.get('classes', 0)
-                print(f"PhoenixExpert: {project_name} - {project_stats.get('java_files', 0)} Java files, "
-                      f"{project_stats.get('classes', 0)} classes")
+            for project_name, project_path in self.phoenix_projects.items():
+                if not project_path.exists():
+                    print(f"PhoenixExpert: Project {project_name} not found, skipping...")
+                    continue
+                
+                print(f"\nPhoenixExpert: Analyzing {project_name}...")
+                project_stats = self._analyze_project(
+                    project_path,
+                    project_name,
+                    {path: parsed_files[path] for path in project_files[project_name]}
+                )
+                
+                if project_stats:
+                    self._codebase_cache['projects'][project_name] = project_stats
+                    total_java_files += project_stats.get('java_files', 0)
+                    total_classes += project_stats.get('classes', 0)
+                    print(f"PhoenixExpert: {project_name} - {project_stats.get('java_files', 0)} Java files, "
+                          f"{project_stats.get('classes', 0)} classes")
+        finally:
+            if self._parse_cache is not None:
+                self._parse_cache.close()
+                self._parse_cache = None
         
         print("\n" + "="*70)
         print(f"PhoenixExpert: Comprehensive analysis complete!")
@@ -238,13 +843,36 @@ class PhoenixExpert:
         print(f"PhoenixExpert: Total packages: {len(self._codebase_cache['packages'])}")
         print("="*70)
     
-    def _analyze_project(self, project_path: Path, project_name: str) -> Optional[Dict[str, Any]]:
+    def _java_source_dirs(self, project_path: Path) -> List[Path]:
+        """Get the existing Java source directories of a project."""
+        return [
+            source_dir
+            for source_dir in (project_path / "src" / "main" / "java", project_path / "src" / "test" / "java")
+            if source_dir.exists()
+        ]
+    
+    def _collect_java_files(self, project_path: Path) -> List[str]:
+        """Collect all Java file paths of a project."""
+        return [
+            java_file
+            for source_dir in self._java_source_dirs(project_path)
+            for java_file in _find_java_files(str(source_dir))
+        ]
+    
+    def _analyze_project(
+        self,
+        project_path: Path,
+        project_name: str,
+        parsed_files: Optional[Dict[str, Optional[Dict[str, Any]]]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Analyze a single Phoenix project.
         
         Args:
             project_path: Path to the project directory
             project_name: Name of the project
+            parsed_files: Optional pre-parsed files of this project (path -> parsed
+                file or None if unreadable); parsed here when not given
             
         Returns:
             Dictionary with project statistics
@@ -253,16 +881,7 @@ class PhoenixExpert:
             return None
         
         # Find Java source directories
-        java_source_dirs = []
-        src_main_java = project_path / "src" / "main" / "java"
-        src_test_java = project_path / "src" / "test" / "java"
-        
-        if src_main_java.exists():
-            java_source_dirs.append(src_main_java)
-        if src_test_java.exists():
-            java_source_dirs.append(src_test_java)
-        
-        if not java_source_dirs:
+        if not self._java_source_dirs(project_path):
             return {'java_files': 0, 'classes': 0, 'controllers': 0, 'services': 0, 'repositories': 0}
         
         project_stats = {
@@ -275,73 +894,154 @@ class PhoenixExpert:
             'packages': set()
         }
         
-        # Collect all Java files from this project
-        java_files = []
-        for source_dir in java_source_dirs:
-            java_files.extend(list(source_dir.rglob("*.java")))
+        if parsed_files is None:
+            parsed_files = self._parse_java_files(self._collect_java_files(project_path))
         
-        project_stats['java_files'] = len(java_files)
+        project_stats['java_files'] = len(parsed_files)
         
-        for java_file in java_files:
-            try:
-                with open(java_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
-                # Extract package
-                package_match = re.search(r'package\s+([\w.]+);', content)
-                if package_match:
-                    package = package_match.group(1)
-                    self._codebase_cache['packages'].add(package)
-                    project_stats['packages'].add(package)
-                    
-                    # Extract class/interface name
-                    class_match = re.search(r'(?:public\s+)?(?:abstract\s+)?(?:class|interface|enum)\s+(\w+)', content)
-                    if class_match:
-                        class_name = class_match.group(1)
-                        relative_path = str(java_file.relative_to(project_path))
-                        full_class_name = f"{package}.{class_name}"
-                        
-                        class_info = {
-                            'name': class_name,
-                            'package': package,
-                            'path': relative_path,
-                            'full_path': str(java_file),
-                            'type': self._detect_class_type(content, class_name),
-                            'project': project_name
-                        }
-                        
-                        # Only add if not already exists (avoid duplicates)
-                        if full_class_name not in self._codebase_cache['classes']:
-                            self._codebase_cache['classes'][full_class_name] = class_info
-                            project_stats['classes'] += 1
-                            
-                            # Categorize by type
-                            if 'Controller' in class_name or '@RestController' in content or '@Controller' in content:
-                                self._codebase_cache['controllers'][f"{project_name}.{class_name}"] = class_info
-                                project_stats['controllers'] += 1
-                            elif 'Service' in class_name and 'interface' not in content.lower():
-                                self._codebase_cache['services'][f"{project_name}.{class_name}"] = class_info
-                                project_stats['services'] += 1
-                            elif 'Repository' in class_name or 'extends JpaRepository' in content or 'extends CrudRepository' in content:
-                                self._codebase_cache['repositories'][f"{project_name}.{class_name}"] = class_info
-                                project_stats['repositories'] += 1
-                            elif 'model' in package.lower() or 'entity' in package.lower() or '@Entity' in content:
-                                self._codebase_cache['models'][f"{project_name}.{class_name}"] = class_info
-                                project_stats['models'] += 1
-                            
-                            # Extract dependencies (imports)
-                            imports = re.findall(r'import\s+([\w.]+);', content)
-                            for imp in imports:
-                                if 'phoenix' in imp.lower() or 'bg.energo' in imp.lower():
-                                    self._codebase_cache['dependencies'][full_class_name].add(imp)
-            except Exception as e:
+        # Collected paths all start with the project path
+        prefix_length = len(str(project_path)) + 1
+        
+        classes = self._codebase_cache['classes']
+        packages = self._codebase_cache['packages']
+        dependencies = self._codebase_cache['dependencies']
+        project_packages = project_stats['packages']
+        
+        for path, parsed in parsed_files.items():
+            if parsed is None:
                 # Silently skip files that can't be read
-                pass
+                continue
+            
+            package = parsed['package']
+            if not package:
+                continue
+            # Many classes share a package; keep one copy of each name
+            package = sys.intern(package)
+            packages.add(package)
+            project_packages.add(package)
+            
+            class_name = parsed['class_name']
+            if not class_name:
+                continue
+            full_class_name = f"{package}.{class_name}"
+            
+            # Only add if not already exists (avoid duplicates)
+            if full_class_name in classes:
+                continue
+            
+            class_info = {
+                'name': class_name,
+                'package': package,
+                'path': path[prefix_length:],
+                'full_path': path,
+                'type': sys.intern(parsed['type']),
+                'project': project_name
+            }
+            classes[full_class_name] = class_info
+            project_stats['classes'] += 1
+            
+            category = parsed['category']
+            if category:
+                self._codebase_cache[category][f"{project_name}.{class_name}"] = class_info
+                project_stats[category] += 1
+            
+            if parsed['imports']:
+                dependencies[full_class_name].update(parsed['imports'])
         
         # Convert set to list for JSON serialization
         project_stats['packages'] = len(project_stats['packages'])
         return project_stats
     
+    def _parse_java_files(self, paths: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Parse Java files, reusing cached results for unchanged files.
+        
+        Size/mtime are checked against the parse cache first so unchanged files
+        are not even read; a touched file with identical content keeps its cached
+        result. The remaining files are parsed in worker processes when there are
+        at least PARALLEL_PARSE_MIN_FILES of them.
+        
+        Args:
+            paths: Absolute paths to Java files
+        
+        Returns:
+            Dictionary of path -> parsed file (see _parse_java_content), or None
+            for files that can't be read
+        """
+        cache = self._parse_cache
+        rows = {}
+        if cache is not None:
+            try:
+                rows = {
+                    row[0]: row[1:]
+                    for row in cache.execute(
+                        'SELECT path, mtime_ns, size, sha256, package, class_name, type, category, imports '
+                        'FROM parse_cache'
+                    )
+                }
+            except sqlite3.Error as e:
+                print(f"PhoenixExpert: ⚠ Failed to read parse cache: {str(e)}")
+        
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        misses = []
+        for path in paths:
+            results[path] = None
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            row = rows.get(path)
+            if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+                results[path] = self._parsed_from_row(row)
+            else:
+                misses.append(path)
+        
+        known_digests = [rows[path][2] if path in rows else None for path in misses]
+        updates = []
+        for path, outcome in zip(misses, self._parse_uncached(misses, known_digests)):
+            if outcome is None:
+                continue
+            mtime_ns, size, digest, parsed = outcome
+            if parsed is None:
+                parsed = self._parsed_from_row(rows[path])
+            results[path] = parsed
+            updates.append((path, mtime_ns, size, digest, parsed['package'], parsed['class_name'],
+                            parsed['type'], parsed['category'], json.dumps(parsed['imports'])))
+        
+        if cache is not None and updates:
+            try:
+                with cache:
+                    cache.executemany('INSERT OR REPLACE INTO parse_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', updates)
+            except sqlite3.Error as e:
+                print(f"PhoenixExpert: ⚠ Failed to update parse cache: {str(e)}")
+        
+        return results
+    
+    @staticmethod
+    def _parse_uncached(
+        paths: List[str],
+        known_digests: List[Optional[bytes]]
+    ) -> List[Optional[Tuple[int, int, bytes, Optional[Dict[str, Any]]]]]:
+        """Run _parse_java_file over paths, across CPU cores for large batches."""
+        if len(paths) >= PARALLEL_PARSE_MIN_FILES:
+            try:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                    return list(executor.map(_parse_java_file, paths, known_digests, chunksize=64))
+            except Exception as e:
+                print(f"PhoenixExpert: ⚠ Parallel parsing failed, parsing serially: {str(e)}")
+        return list(map(_parse_java_file, paths, known_digests))
+    
+    @staticmethod
+    def _parsed_from_row(row: Tuple) -> Dict[str, Any]:
+        """Convert a parse_cache row back into a parsed file dictionary."""
+        return {
+            'package': row[3],
+            'class_name': row[4],
+            'type': row[5],
+            'category': row[6],
+            'imports': json.loads(row[7])
+        }
+    
     def _analyze_codebase_structure(self):
         """Analyze Phoenix codebase structure for better understanding (legacy method - now uses _analyze_all_phoenix_projects)."""
         # This method is kept for backward compatibility
@@ -349,22 +1049,8 @@ class PhoenixExpert:
     
     def _detect_class_type(self, content: str, class_name: str) -> str:
         """Detect the type of Java class."""
-        if 'interface' in content[:500]:
-            return 'interface'
-        elif 'enum' in content[:500]:
-            return 'enum'
-        elif '@RestController' in content or '@Controller' in content:
-            return 'controller'
-        elif 'extends JpaRepository' in content or 'extends CrudRepository' in content:
-            return 'repository'
-        elif '@Service' in content:
-            return 'service'
-        elif '@Entity' in content:
-            return 'entity'
-        elif 'abstract' in content[:500]:
-            return 'abstract_class'
-        else:
-            return 'class'
+        encoded = content.encode('utf-8')
+        return _detect_class_type(content[:500], encoded, *_class_markers(encoded))
     
     def get_domain_info(self, domain: str) -> Optional[Dict[str, Any]]:
         """
@@ -404,49 +1090,291 @@ class PhoenixExpert:
         
         return matches if matches else None
     
-    def search_codebase(self, search_term: str) -> List[str]:
+    def search_codebase(self, search_term: str, limit: Optional[int] = None) -> List[str]:
         """
         Search for files or content in all Phoenix projects.
         READ-ONLY operation - returns file paths only.
+        
+        Args:
+            search_term: Text to search for (case-insensitive)
+            limit: Optional maximum number of results; scanning stops once reached
+        """
+        search_term_lower = search_term.lower()
+        results = [
+            display_path
+            for display_path, found in self._scan_files(
+                lambda path: self._file_contains(path, search_term_lower), limit
+            )
+            if found
+        ]
+        return results[:limit] if limit is not None else results
+    
+    def search_codebase_keywords(self, question: str, limit: Optional[int] = None) -> List[str]:
+        """
+        Search for files containing any keyword of a question in all Phoenix projects.
+        READ-ONLY operation - returns file paths only.
+        
+        Unlike search_codebase, the question does not have to appear verbatim:
+        files are ranked by how many distinct keywords (words of at least
+        MIN_KEYWORD_LENGTH characters) they contain, ties keeping scan order.
+        
+        Args:
+            question: Free-text question
+            limit: Optional maximum number of results; scanning stops once this
+                many files containing every keyword have been found
+        
+        Returns:
+            List of "project/relative/path" strings, best match first
+        """
+        keywords = _question_keywords(question)
+        if not keywords:
+            return self.search_codebase(question, limit)
+        
+        def count_hits(path: str) -> int:
+            content = self._get_file_text(path)
+            if content is None:
+                return 0
+            return sum(keyword in content for keyword in keywords)
+        
+        # Later files can at best tie with files containing every keyword, and
+        # ties keep scan order, so the first `limit` such files are the top results
+        scanned = self._scan_files(count_hits, limit, lambda hits: hits == len(keywords))
+        scored = [(hits, display_path) for display_path, hits in scanned if hits]
+        scored.sort(key=lambda item: item[0], reverse=True)
+        results = [display_path for _, display_path in scored]
+        return results[:limit] if limit is not None else results
+    
+    def _scan_files(
+        self,
+        check: Callable[[str], Any],
+        limit: Optional[int] = None,
+        qualifies: Callable[[Any], bool] = bool
+    ) -> List[Tuple[str, Any]]:
+        """
+        Run a check on every Java file of all Phoenix projects, across SEARCH_THREADS threads.
+        
+        Files are split into contiguous shards so results keep scan order and
+        only a handful of tasks are scheduled per search.
+        
+        Args:
+            check: Function called with each file's absolute path
+            limit: Optional number of qualifying results after which scanning may stop
+            qualifies: Predicate on check results counted towards limit
+        
+        Returns:
+            List of ("project/relative/path", check result) tuples in scan order.
+            With a limit, the list ends once `limit` qualifying results are included.
         """
+        files = list(self._iter_java_files())
+        shard_size = max(1, -(-len(files) // SEARCH_THREADS))
+        shards = [files[i:i + shard_size] for i in range(0, len(files), shard_size)]
+        stop = threading.Event()
+        
+        def scan_shard(shard: List[Tuple[str, str]]) -> List[Tuple[str, Any]]:
+            shard_results = []
+            found = 0
+            for display_path, path in shard:
+                if stop.is_set():
+                    break
+                result = check(path)
+                shard_results.append((display_path, result))
+                # Files after this shard's first `limit` matches can't make the cut
+                if limit is not None and qualifies(result):
+                    found += 1
+                    if found >= limit:
+                        break
+            return shard_results
+        
         results = []
-        search_term_lower = search_term.lower()
+        found = 0
+        for shard_results in _SEARCH_EXECUTOR.map(scan_shard, shards):
+            for item in shard_results:
+                results.append(item)
+                if limit is not None and qualifies(item[1]):
+                    found += 1
+                    if found >= limit:
+                        # Earlier shards already supply the results; cut later ones short
+                        stop.set()
+                        return results
+        return results
+    
+    def _iter_java_files(self):
+        """
+        Iterate over the Java files of all Phoenix projects (src/main/java and src/test/java).
         
-        # Search in all Phoenix projects
+        Yields:
+            ("project/relative/path", absolute path) tuples
+        """
         for project_name, project_path in self.phoenix_projects.items():
             if not project_path.exists():
                 continue
             
-            # Search in src/main/java and src/test/java
+            prefix_length = len(str(project_path)) + 1
             for source_type in ["main", "test"]:
                 java_dir = project_path / "src" / source_type / "java"
                 if java_dir.exists():
-                    for java_file in java_dir.rglob("*.java"):
-                        try:
-                            with open(java_file, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                if search_term_lower in content.lower():
-                                    relative_path = str(java_file.relative_to(project_path))
-                                    results.append(f"{project_name}/{relative_path}")
-                        except Exception:
-                            pass
+                    for java_file in _find_java_files(str(java_dir)):
+                        yield f"{project_name}/{java_file[prefix_length:]}", java_file
+    
+    def _get_file_text(self, path: str) -> Optional[str]:
+        """
+        Get the lowercased content of a Java file.
         
-        return results
+        Content is kept in memory (up to FILE_TEXT_CACHE_SIZE files) and reused
+        while the file's size/mtime are unchanged, so repeated searches do not
+        re-read the codebase.
+        
+        Args:
+            path: Path to the Java file
+        
+        Returns:
+            Lowercased file content, or None if the file can't be read
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        
+        cached = self._file_text_cache.get(path)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                content = f.read().lower()
+        except Exception:
+            return None
+        
+        # Once full, keep the resident files instead of evicting: every search
+        # scans all files in the same order, so LRU eviction would make each
+        # lookup a miss on codebases larger than the cache. Concurrent scan
+        # threads may overshoot the limit by a few entries, which is harmless.
+        if cached or len(self._file_text_cache) < FILE_TEXT_CACHE_SIZE:
+            self._file_text_cache[path] = (st.st_mtime_ns, st.st_size, content)
+        return content
+    
+    def _file_contains(self, path: str, term_lower: str) -> bool:
+        """
+        Check whether a Java file contains a lowercased search term.
+        
+        Files that don't fit in the text cache (see _get_file_text) are streamed
+        and the read stops at the first match.
+        
+        Args:
+            path: Path to the Java file
+            term_lower: Lowercased search term
+        
+        Returns:
+            True if the file contains the term, False otherwise or if it can't be read
+        """
+        if path not in self._file_text_cache and len(self._file_text_cache) >= FILE_TEXT_CACHE_SIZE:
+            return _stream_contains(path, term_lower)
+        content = self._get_file_text(path)
+        return content is not None and term_lower in content
+    
+    def _ensure_class_index(self):
+        """Index classes added to the cache since the last lookup."""
+        classes = self._codebase_cache['classes']
+        if len(self._class_infos) == len(classes):
+            return
+        
+        # Shared across threads: re-read the indexed count under the lock so
+        # concurrent first lookups don't both append the same tail
+        with self._codebase_lock:
+            indexed = len(self._class_infos)
+            if indexed == len(classes):
+                return
+            # Classes are only ever appended, so new entries are the dict's tail
+            for ordinal, (full_name, info) in enumerate(itertools.islice(classes.items(), indexed, None), indexed):
+                # Packages and types repeat across many classes; interning stores each once
+                fields = (
+                    info['name'].lower(),
+                    full_name.lower(),
+                    sys.intern(info['package'].lower()),
+                    sys.intern(info['type'].lower())
+                )
+                self._class_infos.append(info)
+                self._class_names_lower.append(fields[0])
+                self._class_full_names_lower.append(fields[1])
+                self._class_packages_lower.append(fields[2])
+                self._class_types_lower.append(fields[3])
+                self._class_exact.setdefault(info['name'], ordinal)
+                self._class_exact.setdefault(full_name, ordinal)
+                for field in fields:
+                    for i in range(len(field) - 2):
+                        self._class_trigrams[field[i:i + 3]].add(ordinal)
+    
+    def _class_candidates(self, text_lower: str) -> List[int]:
+        """
+        Get ordinals (in insertion order) of classes whose indexed fields may contain text_lower.
+        
+        Candidates must still be checked against the actual fields; queries too
+        short to have a trigram match every class.
+        """
+        return _trigram_candidates(self._class_trigrams, text_lower, len(self._class_infos))
+    
+    def _category_matches(self, category: str, text_lower: str) -> List[Dict[str, Any]]:
+        """
+        Get entries of a category dict (e.g. 'controllers') whose lowercased key contains text_lower.
+        
+        Keys are trigram-indexed as they are added, so text longer than every key
+        (such as a whole question) is rejected without a scan.
+        
+        Returns:
+            Matching class info dicts, in the category's insertion order
+        """
+        entries = self._codebase_cache[category]
+        # Shared across threads: create and extend the index under the lock, like the class index
+        with self._codebase_lock:
+            index = self._category_indexes.get(category)
+            if index is None:
+                index = self._category_indexes[category] = {
+                    'keys': [],
+                    'keys_lower': [],
+                    'trigrams': defaultdict(set),
+                    'max_length': 0
+                }
+            keys = index['keys']
+            keys_lower = index['keys_lower']
+            trigrams = index['trigrams']
+            
+            # Keys are only ever added (re-assigning one keeps its position), so new keys are the dict's tail
+            for ordinal, key in enumerate(itertools.islice(entries, len(keys), None), len(keys)):
+                key_lower = key.lower()
+                keys.append(key)
+                keys_lower.append(key_lower)
+                index['max_length'] = max(index['max_length'], len(key_lower))
+                for i in range(len(key_lower) - 2):
+                    trigrams[key_lower[i:i + 3]].add(ordinal)
+            count = len(keys)
+        
+        if len(text_lower) > index['max_length']:
+            return []
+        return [
+            entries[keys[ordinal]]
+            for ordinal in _trigram_candidates(trigrams, text_lower, count)
+            if text_lower in keys_lower[ordinal]
+        ]
     
     def get_class_info(self, class_name: str) -> Optional[Dict[str, Any]]:
         """
         Get detailed information about a specific class.
         READ-ONLY operation.
         """
+        self._ensure_class_index()
+        
         # Try exact match first
-        for full_name, info in self._codebase_cache['classes'].items():
-            if info['name'] == class_name or full_name == class_name:
-                return info
+        ordinal = self._class_exact.get(class_name)
+        if ordinal is not None:
+            return self._class_infos[ordinal]
         
         # Try partial match
-        for full_name, info in self._codebase_cache['classes'].items():
-            if class_name.lower() in info['name'].lower() or class_name.lower() in full_name.lower():
-                return info
+        class_name_lower = class_name.lower()
+        names_lower = self._class_names_lower
+        full_names_lower = self._class_full_names_lower
+        for ordinal in self._class_candidates(class_name_lower):
+            if class_name_lower in names_lower[ordinal] or class_name_lower in full_names_lower[ordinal]:
+                return self._class_infos[ordinal]
         
         return None
     
@@ -455,11 +1383,15 @@ class PhoenixExpert:
         Get all classes in a specific package.
         READ-ONLY operation.
         """
-        results = []
-        for full_name, info in self._codebase_cache['classes'].items():
-            if package_name.lower() in info['package'].lower():
-                results.append(info)
-        return results
+        self._ensure_class_index()
+        package_name_lower = package_name.lower()
+        packages_lower = self._class_packages_lower
+        
+        return [
+            self._class_infos[ordinal]
+            for ordinal in self._class_candidates(package_name_lower)
+            if package_name_lower in packages_lower[ordinal]
+        ]
     
     def get_controllers(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -497,16 +1429,19 @@ class PhoenixExpert:
         Search for classes matching a pattern (name, package, or type).
         READ-ONLY operation.
         """
-        results = []
+        self._ensure_class_index()
         pattern_lower = pattern.lower()
+        names_lower = self._class_names_lower
+        packages_lower = self._class_packages_lower
+        types_lower = self._class_types_lower
         
-        for full_name, info in self._codebase_cache['classes'].items():
-            if (pattern_lower in info['name'].lower() or
-                pattern_lower in info['package'].lower() or
-                pattern_lower in info['type'].lower()):
-                results.append(info)
-        
-        return results
+        return [
+            self._class_infos[ordinal]
+            for ordinal in self._class_candidates(pattern_lower)
+            if (pattern_lower in names_lower[ordinal] or
+                pattern_lower in packages_lower[ordinal] or
+                pattern_lower in types_lower[ordinal])
+        ]
     
     def get_codebase_statistics(self) -> Dict[str, Any]:
         """
@@ -560,20 +1495,118 @@ class PhoenixExpert:
             search_query: Search query string
             
         Returns:
-            Dictionary with instructions for Cursor AI to use MCP tools
+            Dictionary with instructions for Cursor AI to use MCP tools, or with the
+            cached results if this query was answered within CONFLUENCE_CACHE_TTL seconds
         """
+        cached = self._confluence_cache.get_fresh(_normalize_question(search_query))
+        if cached is not None:
+            return {
+                'instructions': 'Confluence results are cached - no MCP calls needed',
+                'search_query': search_query,
+                'cached_results': cached,
+                'note': 'Pass cached_results to answer_question as confluence_data'
+            }
+        
         return {
             'instructions': 'Use MCP Confluence tools to search Confluence',
             'search_query': search_query,
-            'mcp_tools_to_use': [
-                'mcp_Confluence_search',
-                'mcp_Confluence_getConfluenceSpaces',
-                'mcp_Confluence_getPagesInConfluenceSpace',
-                'mcp_Confluence_getConfluencePage'
-            ],
+            'mcp_tools_to_use': _CONFLUENCE_SEARCH_MCP_TOOLS,
             'note': 'Cursor AI should call these MCP tools directly when PhoenixExpert needs Confluence data'
         }
     
+    def cache_confluence_result(self, question: str, confluence_data: List[Dict[str, Any]]):
+        """
+        Remember Confluence results for a question so repeats skip the MCP round-trips.
+        
+        Args:
+            question: Question the results were fetched for
+            confluence_data: Results in the answer_question confluence_data format
+        """
+        self._confluence_cache.put(_normalize_question(question), confluence_data)
+    
+    async def batch_fetch_confluence(
+        self,
+        question: str,
+        mcp_client,
+        max_pages: int = CONFLUENCE_BATCH_MAX_PAGES
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch Confluence pages for a question with concurrent MCP calls.
+        
+        Runs the answer_question workflow in two rounds instead of one call at a time:
+        the search and per-space title lookups run together, then all matching pages
+        are fetched together. The cloud ID and space list are fetched once per instance.
+        
+        Args:
+            question: Question to search Confluence for
+            mcp_client: Client exposing the MCP Confluence tools as coroutine methods
+                named without the 'mcp_Confluence_' prefix (search,
+                getAccessibleAtlassianResources, getConfluenceSpaces,
+                getPagesInConfluenceSpace, getConfluencePage)
+            max_pages: Maximum number of pages to fetch
+            
+        Returns:
+            List of dicts with 'title', 'content', 'pageId', 'spaceId' keys,
+            ready to pass to answer_question as confluence_data
+        """
+        cached = self._confluence_cache.get_fresh(_normalize_question(question))
+        if cached is not None:
+            return cached
+        
+        if self.confluence_cloud_id is None:
+            resources = _confluence_results(await mcp_client.getAccessibleAtlassianResources())
+            if not resources:
+                print("PhoenixExpert: ⚠ No accessible Atlassian resources - skipping Confluence")
+                return []
+            self.confluence_cloud_id = resources[0].get('id')
+        cloud_id = self.confluence_cloud_id
+        
+        if self._confluence_spaces is None:
+            self._confluence_spaces = _confluence_results(await mcp_client.getConfluenceSpaces(cloudId=cloud_id))
+        
+        lookups = [mcp_client.search(query=question)]
+        lookups.extend(
+            mcp_client.getPagesInConfluenceSpace(cloudId=cloud_id, spaceId=space.get('id'), title=question)
+            for space in self._confluence_spaces
+        )
+        
+        # Page ID -> space ID, in result order (search hits first)
+        candidates: Dict[str, Optional[str]] = {}
+        for result in await asyncio.gather(*lookups, return_exceptions=True):
+            if isinstance(result, Exception):
+                print(f"PhoenixExpert: ⚠ Confluence lookup failed: {str(result)}")
+                continue
+            for item in _confluence_results(result):
+                page_id = item.get('pageId') or item.get('id') or (item.get('content') or {}).get('id')
+                if page_id:
+                    candidates.setdefault(str(page_id), item.get('spaceId'))
+        
+        page_ids = list(candidates)[:max_pages]
+        pages = await asyncio.gather(
+            *(mcp_client.getConfluencePage(cloudId=cloud_id, pageId=page_id) for page_id in page_ids),
+            return_exceptions=True
+        )
+        
+        confluence_data = []
+        for page_id, page in zip(page_ids, pages):
+            if isinstance(page, Exception):
+                print(f"PhoenixExpert: ⚠ Failed to fetch Confluence page {page_id}: {str(page)}")
+                continue
+            if not isinstance(page, dict):
+                page = {'content': page}
+            body = page.get('body')
+            if isinstance(body, dict):
+                body = (body.get('storage') or {}).get('value', '')
+            confluence_data.append({
+                'title': page.get('title', ''),
+                'content': page.get('content') or body or '',
+                'pageId': page_id,
+                'spaceId': page.get('spaceId') or candidates[page_id]
+            })
+        
+        self.cache_confluence_result(question, confluence_data)
+        return confluence_data
+    
     def get_confluence_spaces_mcp(self) -> Dict[str, Any]:
         """
         Get Confluence spaces using MCP Confluence tools.
@@ -613,13 +1646,10 @@ class PhoenixExpert:
         
         This ensures PhoenixExpert ALWAYS has fresh Confluence data for every question.
         """
-        # #region agent log
-        import json
-        try:
-            with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'id': 'log_qa_entry', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:588', 'message': 'answer_question called', 'data': {'question': question[:100], 'has_confluence_data': confluence_data is not None}, 'sessionId': 'debug-session', 'runId': 'run1', 'hypothesisId': 'A'}) + '\n')
-        except: pass
-        # #endregion
+        if DEBUG_ENABLED:
+            _debug_log('log_qa_entry', 'phoenix_expert.py:588', 'answer_question called',
+                       {'question': question[:100], 'has_confluence_data': confluence_data is not None},
+                       'run1', 'A')
         response = {
             'question': question,
             'sources': {
@@ -634,17 +1664,19 @@ class PhoenixExpert:
             'confluence_checked': False,
             'mcp_confluence_instructions': None
         }
+        sources = response['sources']
         
         # ALWAYS search codebase first (primary source)
         print("PhoenixExpert: Searching Phoenix codebase...")
-        code_results = self.search_codebase(question)
+        # Limit to 10 results; the search already stops there, so no slicing is needed
+        code_results = self.search_codebase_keywords(question, limit=10)
         if code_results:
-            response['sources']['code'] = code_results[:10]  # Limit to 10 results
+            sources['code'] = code_results
         
         # Search classes by pattern
         class_results = self.search_classes_by_pattern(question)
         if class_results:
-            response['sources']['classes'] = [
+            sources['classes'] = [
                 {
                     'name': c['name'],
                     'package': c['package'],
@@ -656,27 +1688,35 @@ class PhoenixExpert:
         
         # Check for specific controller/service matches
         question_lower = question.lower()
-        for name, info in self._codebase_cache['controllers'].items():
-            if question_lower in name.lower():
-                response['sources']['controllers'].append({
-                    'name': info['name'],
-                    'package': info['package'],
-                    'path': info['path']
-                })
-        
-        for name, info in self._codebase_cache['services'].items():
-            if question_lower in name.lower():
-                response['sources']['services'].append({
-                    'name': info['name'],
-                    'package': info['package'],
-                    'path': info['path']
-                })
+        sources['controllers'] = [
+            {
+                'name': info['name'],
+                'package': info['package'],
+                'path': info['path']
+            }
+            for info in self._category_matches('controllers', question_lower)
+        ]
+        
+        sources['services'] = [
+            {
+                'name': info['name'],
+                'package': info['package'],
+                'path': info['path']
+            }
+            for info in self._category_matches('services', question_lower)
+        ]
         
         # ALWAYS check Confluence second (secondary source) - fresh via MCP
         print("PhoenixExpert: Checking Confluence via MCP...")
+        if confluence_data:
+            self.cache_confluence_result(question, confluence_data)
+        else:
+            confluence_data = self._confluence_cache.get_fresh(_normalize_question(question))
+            if confluence_data:
+                print("PhoenixExpert: Using Confluence results cached for this question")
         if confluence_data:
             # Use provided Confluence data from MCP
-            response['sources']['confluence'] = confluence_data[:10]  # Limit to 10 results
+            sources['confluence'] = confluence_data[:10]  # Limit to 10 results
             response['confluence_checked'] = True
         else:
             # Indicate that Cursor AI should use MCP Confluence tools
@@ -685,168 +1725,146 @@ class PhoenixExpert:
             print("PhoenixExpert: ⚠ Confluence data not provided - Cursor AI should use MCP Confluence tools")
         
         # Generate answer based on available sources
-        if response['sources']['code'] or response['sources']['classes']:
-            total_found = len(response['sources']['code']) + len(response['sources']['classes'])
-            response['answer'] = f"Found {total_found} relevant items in Phoenix codebase. Code is the primary source of truth."
-        elif response['sources']['confluence']:
-            response['answer'] = f"Found {len(response['sources']['confluence'])} relevant Confluence pages. Note: Code takes precedence over Confluence."
+        code_sources = sources['code']
+        class_sources = sources['classes']
+        confluence_sources = sources['confluence']
+        if code_sources or class_sources:
+            total_found = len(code_sources) + len(class_sources)
+            answer = f"Found {total_found} relevant items in Phoenix codebase. Code is the primary source of truth."
+        elif confluence_sources:
+            answer = f"Found {len(confluence_sources)} relevant Confluence pages. Note: Code takes precedence over Confluence."
         else:
-            response['answer'] = "No relevant information found in Phoenix codebase or Confluence."
+            answer = "No relevant information found in Phoenix codebase or Confluence."
+        response['answer'] = answer
         
-        # #region agent log
-        try:
-            with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'id': 'log_qa_exit', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:695', 'message': 'answer_question returning', 'data': {'has_answer': bool(response.get('answer')), 'has_reporting_service': self.reporting_service is not None}, 'sessionId': 'debug-session', 'runId': 'run1', 'hypothesisId': 'A'}) + '\n')
-        except: pass
-        # #endregion
+        if DEBUG_ENABLED:
+            _debug_log('log_qa_exit', 'phoenix_expert.py:695', 'answer_question returning',
+                       {'has_answer': bool(answer), 'has_reporting_service': self.reporting_service is not None},
+                       'run1', 'A')
         
         # Log to reporting service
-        if self.reporting_service:
+        if self.reporting_service and self.reporting_service.is_enabled():
             try:
                 # Always log activity, even if no sources found
-                total_sources = (
-                    len(response['sources']['code']) + 
-                    len(response['sources']['classes']) + 
-                    len(response['sources']['controllers']) + 
-                    len(response['sources']['services']) + 
-                    len(response['sources']['confluence'])
-                )
+                total_sources = sum(map(len, sources.values()))
                 
-                # Log information sources
-                if response['sources']['code']:
-                    for code_file in response['sources']['code'][:5]:  # Log first 5
-                        self.reporting_service.log_information_source(
-                            agent_name="PhoenixExpert",
-                            source_type="code",
-                            source_description=str(code_file),
-                            information=f"Found in codebase for question: {question[:100]}"
-                        )
+                # Log information sources (first 5 of each kind) in one batch
+                question_preview = question[:100]
+                code_information = f"Found in codebase for question: {question_preview}"
+                class_information = f"Found class for question: {question_preview}"
+                controller_information = f"Found controller for question: {question_preview}"
+                service_information = f"Found service for question: {question_preview}"
+                confluence_information = f"Found in Confluence for question: {question_preview}"
+                information_sources = []
+                for code_file in code_sources[:5]:
+                    information_sources.append({
+                        'source_type': "code",
+                        'source_description': str(code_file),
+                        'information': code_information
+                    })
                 
-                if response['sources']['classes']:
-                    for class_info in response['sources']['classes'][:5]:
-                        self.reporting_service.log_information_source(
-                            agent_name="PhoenixExpert",
-                            source_type="class",
-                            source_description=f"{class_info.get('package', '')}.{class_info.get('name', '')}",
-                            information=f"Found class for question: {question[:100]}"
-                        )
+                for class_info in class_sources[:5]:
+                    information_sources.append({
+                        'source_type': "class",
+                        'source_description': f"{class_info['package']}.{class_info['name']}",
+                        'information': class_information
+                    })
                 
-                if response['sources']['controllers']:
-                    for controller_info in response['sources']['controllers'][:5]:
-                        self.reporting_service.log_information_source(
-                            agent_name="PhoenixExpert",
-                            source_type="controller",
-                            source_description=f"{controller_info.get('package', '')}.{controller_info.get('name', '')}",
-                            information=f"Found controller for question: {question[:100]}"
-                        )
+                for controller_info in sources['controllers'][:5]:
+                    information_sources.append({
+                        'source_type': "controller",
+                        'source_description': f"{controller_info['package']}.{controller_info['name']}",
+                        'information': controller_information
+                    })
                 
-                if response['sources']['services']:
-                    for service_info in response['sources']['services'][:5]:
-                        self.reporting_service.log_information_source(
-                            agent_name="PhoenixExpert",
-                            source_type="service",
-                            source_description=f"{service_info.get('package', '')}.{service_info.get('name', '')}",
-                            information=f"Found service for question: {question[:100]}"
-                        )
+                for service_info in sources['services'][:5]:
+                    information_sources.append({
+                        'source_type': "service",
+                        'source_description': f"{service_info['package']}.{service_info['name']}",
+                        'information': service_information
+                    })
                 
-                if response['sources']['confluence']:
-                    for confluence_page in response['sources']['confluence'][:5]:
-                        self.reporting_service.log_information_source(
-                            agent_name="PhoenixExpert",
-                            source_type="confluence",
-                            source_description=str(confluence_page),
-                            information=f"Found in Confluence for question: {question[:100]}"
-                        )
+                for confluence_page in confluence_sources[:5]:
+                    information_sources.append({
+                        'source_type': "confluence",
+                        'source_description': str(confluence_page),
+                        'information': confluence_information
+                    })
+                
+                if information_sources:
+                    self.reporting_service.log_information_sources_batch("PhoenixExpert", information_sources)
                 
                 # Always log activity (even if no sources found)
                 self.reporting_service.log_activity(
                     agent_name="PhoenixExpert",
                     activity_type="question_answered",
-                    description=f"Answered question: {question[:100]}...",
+                    description=f"Answered question: {question_preview}...",
                     question=question[:500],  # Truncate long questions
-                    answer=response['answer'][:500],  # Include answer in activity
+                    answer=answer[:500],  # Include answer in activity
                     sources_found=total_sources,
-                    answer_length=len(response['answer']),
+                    answer_length=len(answer),
                     has_sources=total_sources > 0
                 )
                 
                 # Log as task execution for better reporting
                 self.reporting_service.log_task_execution(
                     agent_name="PhoenixExpert",
-                    task=f"Answer question: {question[:100]}...",
+                    task=f"Answer question: {question_preview}...",
                     task_type="question_answering",
                     success=True,
                     duration_ms=0,  # Duration should be tracked by caller
                     result={
-                        'answer': response['answer'],
+                        'answer': answer,
                         'sources_count': total_sources,
-                        'has_code_sources': len(response['sources']['code']) > 0,
-                        'has_confluence_sources': len(response['sources']['confluence']) > 0
+                        'has_code_sources': len(code_sources) > 0,
+                        'has_confluence_sources': len(confluence_sources) > 0
                     }
                 )
             except Exception as e:
                 print(f"PhoenixExpert: ⚠ Failed to log to reporting service: {str(e)}")
-                import traceback
                 traceback.print_exc()
         
-        # #region agent log
-        try:
-            with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'id': 'log_qa_before_report', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:792', 'message': 'before auto report generation', 'data': {'has_reporting_service': self.reporting_service is not None}, 'sessionId': 'debug-session', 'runId': 'run1', 'hypothesisId': 'A'}) + '\n')
-        except: pass
-        # #endregion
+        if DEBUG_ENABLED:
+            _debug_log('log_qa_before_report', 'phoenix_expert.py:792', 'before auto report generation',
+                       {'has_reporting_service': self.reporting_service is not None},
+                       'run1', 'A')
         
         # Rule 0.6: MANDATORY Report Generation After Task Completion
         # Automatically save reports after answering question
-        # #region agent log
-        try:
-            with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'id': 'log_qa_check_reporting', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:801', 'message': 'checking reporting_service', 'data': {'has_reporting_service': self.reporting_service is not None, 'reporting_service_type': str(type(self.reporting_service)) if self.reporting_service else None}, 'sessionId': 'debug-session', 'runId': 'run2', 'hypothesisId': 'E'}) + '\n')
-        except Exception as e:
-            print(f"DEBUG: Failed to log: {e}")
-        # #endregion
+        if DEBUG_ENABLED:
+            _debug_log('log_qa_check_reporting', 'phoenix_expert.py:801', 'checking reporting_service',
+                       {'has_reporting_service': self.reporting_service is not None, 'reporting_service_type': str(type(self.reporting_service)) if self.reporting_service else None},
+                       'run2', 'E')
         
-        if self.reporting_service:
+        if self.reporting_service and self.reporting_service.is_enabled():
             try:
-                # #region agent log
-                try:
-                    with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                        f.write(json.dumps({'id': 'log_qa_auto_report_start', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:810', 'message': 'starting auto save reports', 'data': {}, 'sessionId': 'debug-session', 'runId': 'run2', 'hypothesisId': 'E'}) + '\n')
-                except Exception as e:
-                    print(f"DEBUG: Failed to log: {e}")
-                # #endregion
+                if DEBUG_ENABLED:
+                    _debug_log('log_qa_auto_report_start', 'phoenix_expert.py:810', 'starting auto save reports',
+                               {}, 'run2', 'E')
                 
                 agent_report_path = self.reporting_service.save_agent_report("PhoenixExpert")
                 summary_report_path = self.reporting_service.save_summary_report()
                 
-                # #region agent log
-                try:
-                    with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                        f.write(json.dumps({'id': 'log_qa_auto_report_success', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:815', 'message': 'reports saved successfully', 'data': {'agent_report_path': str(agent_report_path), 'summary_report_path': str(summary_report_path)}, 'sessionId': 'debug-session', 'runId': 'run2', 'hypothesisId': 'E'}) + '\n')
-                except Exception as e:
-                    print(f"DEBUG: Failed to log: {e}")
-                # #endregion
+                if DEBUG_ENABLED:
+                    _debug_log('log_qa_auto_report_success', 'phoenix_expert.py:815', 'reports saved successfully',
+                               {'agent_report_path': str(agent_report_path), 'summary_report_path': str(summary_report_path)},
+                               'run2', 'E')
                 
                 print("PhoenixExpert: ✓ Reports automatically saved (Rule 0.6 compliance)")
                 print(f"PhoenixExpert: Agent report: {agent_report_path}")
                 print(f"PhoenixExpert: Summary report: {summary_report_path}")
             except Exception as e:
-                # #region agent log
-                try:
-                    with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                        f.write(json.dumps({'id': 'log_qa_auto_report_error', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:825', 'message': 'failed to save reports', 'data': {'error': str(e)}, 'sessionId': 'debug-session', 'runId': 'run2', 'hypothesisId': 'E'}) + '\n')
-                except: pass
-                # #endregion
+                if DEBUG_ENABLED:
+                    _debug_log('log_qa_auto_report_error', 'phoenix_expert.py:825', 'failed to save reports',
+                               {'error': str(e)},
+                               'run2', 'E')
                 print(f"PhoenixExpert: ⚠ Failed to auto-save reports: {str(e)}")
-                import traceback
                 traceback.print_exc()
-        else:
-            # #region agent log
-            try:
-                with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                    f.write(json.dumps({'id': 'log_qa_no_reporting_service', 'timestamp': __import__('time').time() * 1000, 'location': 'phoenix_expert.py:832', 'message': 'reporting_service is None', 'data': {'REPORTING_SERVICE_AVAILABLE': REPORTING_SERVICE_AVAILABLE}, 'sessionId': 'debug-session', 'runId': 'run2', 'hypothesisId': 'E'}) + '\n')
-            except: pass
-            # #endregion
+        elif not self.reporting_service:
+            if DEBUG_ENABLED:
+                _debug_log('log_qa_no_reporting_service', 'phoenix_expert.py:832', 'reporting_service is None',
+                           {'REPORTING_SERVICE_AVAILABLE': REPORTING_SERVICE_AVAILABLE},
+                           'run2', 'E')
             print("PhoenixExpert: ⚠ Reporting service not available - cannot save reports")
         
         return response
@@ -860,59 +1878,20 @@ class PhoenixExpert:
             question: The question to search for
             
         Returns:
-            Dictionary with step-by-step workflow instructions
+            Dictionary with step-by-step workflow instructions; '<question>' in step
+            parameters refers to the 'question' field
         """
         return {
             'workflow': 'PhoenixExpert Confluence MCP Integration',
-            'steps': [
-                {
-                    'step': 1,
-                    'action': 'Get Confluence cloud ID',
-                    'mcp_tool': 'mcp_Confluence_getAccessibleAtlassianResources',
-                    'description': 'Get accessible Atlassian resources to obtain cloudId'
-                },
-                {
-                    'step': 2,
-                    'action': 'Search Confluence',
-                    'mcp_tool': 'mcp_Confluence_search',
-                    'parameters': {'query': question},
-                    'description': 'Search across all Confluence content for the question'
-                },
-                {
-                    'step': 3,
-                    'action': 'Get Confluence spaces',
-                    'mcp_tool': 'mcp_Confluence_getConfluenceSpaces',
-                    'parameters': {'cloudId': '<from step 1>'},
-                    'description': 'Get all accessible Confluence spaces'
-                },
-                {
-                    'step': 4,
-                    'action': 'Search pages in spaces',
-                    'mcp_tool': 'mcp_Confluence_getPagesInConfluenceSpace',
-                    'parameters': {'cloudId': '<from step 1>', 'spaceId': '<from step 3>', 'title': question},
-                    'description': 'Search for pages matching the question in each space'
-                },
-                {
-                    'step': 5,
-                    'action': 'Get page content',
-                    'mcp_tool': 'mcp_Confluence_getConfluencePage',
-                    'parameters': {'cloudId': '<from step 1>', 'pageId': '<from step 4>'},
-                    'description': 'Get full content of relevant pages'
-                },
-                {
-                    'step': 6,
-                    'action': 'Call PhoenixExpert',
-                    'method': 'answer_question',
-                    'parameters': {'question': question, 'confluence_data': '<results from steps 2-5>'},
-                    'description': 'Call PhoenixExpert with question and Confluence data'
-                }
-            ],
+            'question': question,
+            'steps': _MCP_CONFLUENCE_WORKFLOW_STEPS,
             'note': 'Cursor AI MUST follow this workflow for EVERY Phoenix question to ensure fresh Confluence data'
         }
 
 
 # Initialize PhoenixExpert agent (lazy initialization)
 _phoenix_expert = None
+_phoenix_expert_lock = threading.Lock()
 
 def get_phoenix_expert(export_file_path: Optional[Path] = None) -> PhoenixExpert:
     """
@@ -925,7 +1904,13 @@ def get_phoenix_expert(export_file_path: Optional[Path] = None) -> PhoenixExpert
         PhoenixExpert instance
     """
     global _phoenix_expert
-    if _phoenix_expert is None:
-        _phoenix_expert = PhoenixExpert(export_file_path=export_file_path)
-    return _phoenix_expert
+    expert = _phoenix_expert
+    if expert is not None:
+        return expert
+    
+    # Concurrent first callers must not each construct (and load) their own instance
+    with _phoenix_expert_lock:
+        if _phoenix_expert is None:
+            _phoenix_expert = PhoenixExpert(export_file_path=export_file_path)
+        return _phoenix_expert
 
@@ -21,15 +21,31 @@ BEHAVIOR:
 - Handles test failures gracefully
 """
 
+import atexit
+import functools
 import json
+import logging
+import queue
+import random
+import re
 import subprocess
 import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Callable, Deque, Dict, FrozenSet, List, Any, Optional, Tuple, Union
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ReadTimeoutError
+from urllib3.util.retry import Retry
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 # Import agent registry and adapters
 try:
     from agents.Core import get_agent_registry
@@ -63,6 +79,313 @@ except ImportError:
     POSTMAN_GENERATOR_AVAILABLE = False
     print("TestAgent: Postman collection generator not available.")
 
+# Optional faster JSON (de)serializer for execution reports and runner output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dump_json(obj: Any, pretty: bool = False) -> bytes:
+    """Serialize a report to UTF-8 JSON (orjson when available; non-JSON values are stringified)."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False, default=str).encode('utf-8')
+
+
+def _load_json_file(path: Path) -> Any:
+    """Parse a JSON file (orjson when available; errors are ValueError subclasses either way)."""
+    data = path.read_bytes()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Optional streaming JSON parser for Newman reports
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def _summarize_newman_report(path: Path) -> Dict[str, int]:
+    """
+    Read the run summary counters from a Newman JSON report.
+    
+    The report also holds every request/response execution, so with ijson it
+    is streamed and only the counters are kept; otherwise it is parsed whole.
+    
+    Args:
+        path: Newman JSON report file
+    
+    Returns:
+        Dictionary with 'requests' and 'assertions' totals and the 'failures' count
+    """
+    if not IJSON_AVAILABLE:
+        run = _load_json_file(path).get('run', {})
+        stats = run.get('stats', {})
+        return {
+            'requests': stats.get('requests', {}).get('total', 0),
+            'assertions': stats.get('assertions', {}).get('total', 0),
+            'failures': len(run.get('failures', []))
+        }
+    
+    summary = {'requests': 0, 'assertions': 0, 'failures': 0}
+    with open(path, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'run.failures.item':
+                # One start (or scalar) event per failure; its keys share the prefix
+                if event not in ('map_key', 'end_map', 'end_array'):
+                    summary['failures'] += 1
+            elif event == 'number':
+                if prefix == 'run.stats.requests.total':
+                    summary['requests'] = int(value)
+                elif prefix == 'run.stats.assertions.total':
+                    summary['assertions'] = int(value)
+    return summary
+
+
+# Keyword groups for test type detection, matched against the description's
+# tokens (in priority order: API, UI, integration, E2E)
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+_API_KEYWORDS = frozenset({'api', 'apis', 'endpoint', 'endpoints', 'rest', 'postman', 'http', 'request', 'requests'})
+_UI_KEYWORDS = frozenset({'ui', 'browser', 'playwright', 'selenium', 'page', 'pages', 'click', 'navigate'})
+_INTEGRATION_KEYWORDS = frozenset({'integration', 'service', 'services', 'component', 'components'})
+_E2E_KEYWORDS = frozenset({'e2e'})
+# Multi-word phrases can't be token-matched; only scanned when no keyword hits
+_E2E_PHRASES = ('end-to-end', 'full flow', 'complete flow')
+
+# Endpoint URL or path in a task description
+_ENDPOINT_PATTERN = re.compile(r'https?://[^\s]+|/[a-zA-Z0-9/_-]+')
+
+# Keywords that drive context extraction (HTTP method, customer operation,
+# domain/controller hints), found in one scan of the lowered description
+_CONTEXT_KEYWORD_PATTERN = re.compile(
+    r'customer|create|post|edit|update|put|view|get|delete|patch|validation|permission|domain|controller'
+)
+
+# Customer operation -> context keywords naming it (first match wins), and the
+# HTTP method each CRUD operation maps to
+_CUSTOMER_OPERATIONS = (
+    ('create', ('create', 'post')),
+    ('edit', ('edit', 'update', 'put')),
+    ('view', ('view', 'get')),
+    ('delete', ('delete',)),
+    ('validation', ('validation',)),
+    ('permission', ('permission',)),
+)
+_OPERATION_METHODS = {'create': 'POST', 'edit': 'PUT', 'view': 'GET', 'delete': 'DELETE'}
+# HTTP methods in the order they are looked for in a description
+_HTTP_METHODS = ('get', 'post', 'put', 'delete', 'patch')
+
+# Customer test request bodies that never change, built once. They are only
+# serialized as request JSON, never mutated (master data IDs should be valid).
+_CREATE_CUSTOMER_ADDRESS = {
+    'countryId': 1,
+    'regionId': 1,
+    'municipalityId': 1,
+    'settlementId': 1,
+    'street': 'Test Street',
+    'streetNumber': '1'
+}
+_VALIDATION_CUSTOMER_ADDRESS = {
+    'countryId': 1,
+    'regionId': 1,
+    'municipalityId': 1,
+    'settlementId': 1,
+    'street': 'Test',
+    'streetNumber': '1'
+}
+# Edit request (requires customerDetailsVersion and updateExistingVersion)
+_EDIT_CUSTOMER_REQUEST = {
+    'customerDetailsVersion': 1,  # Should be actual version
+    'updateExistingVersion': True,
+    'customerType': 'PRIVATE',
+    'customerIdentifier': 'TEST_ID',
+    'foreign': False,
+    'marketingConsent': False,
+    'customerDetailStatus': 'ACTIVE',
+    'address': {
+        'countryId': 1,
+        'regionId': 1,
+        'municipalityId': 1,
+        'settlementId': 1,
+        'street': 'Updated Street',
+        'streetNumber': '2'
+    }
+}
+# Validation: missing required fields (customerIdentifier, foreign, marketingConsent, etc.)
+_MISSING_FIELDS_CUSTOMER_REQUEST = {
+    'customerType': 'PRIVATE'
+}
+# Validation: invalid customer identifier length
+_INVALID_ID_CUSTOMER_REQUEST = {
+    'customerType': 'PRIVATE',
+    'customerIdentifier': 'X',  # Too short (min 1, max 17)
+    'foreign': False,
+    'marketingConsent': False,
+    'customerDetailStatus': 'ACTIVE',
+    'address': _VALIDATION_CUSTOMER_ADDRESS
+}
+
+_DOMAIN_HINT_PATTERN = re.compile(r'(\w+)\s+domain')
+_CONTROLLER_HINT_PATTERN = re.compile(r'(\w+)\s+controller')
+
+# Consultation errors that retrying will not fix
+_NON_RETRYABLE_ERROR_PATTERN = re.compile(
+    r'not found|unauthorized|forbidden|invalid|bad request|authentication failed|40[034]'
+)
+
+# Background report writer: writes are batched for up to this many items / seconds
+REPORT_BATCH_SIZE = 32
+REPORT_BATCH_WINDOW = 0.05
+
+# Successful consultations kept for reruns of the same task
+CONSULTATION_CACHE_SIZE = 64
+
+# Exponential backoff between retries (seconds), precomputed for the default retry counts
+_BACKOFF_SECONDS = (1, 2, 4)
+
+
+# API responses retried by the session adapter
+_RETRYABLE_STATUS_CODES = (500, 502, 503, 504)
+
+# Failed API request -> (log label, error prefix), checked in order; Timeout
+# comes first because ConnectTimeout is also a ConnectionError. Read timeouts
+# only raise Timeout when not retried: once the adapter's retries run out they
+# arrive as a ConnectionError wrapping MaxRetryError(reason=ReadTimeoutError),
+# which _api_error_category reports as a timeout too
+_API_ERROR_CATEGORIES = (
+    (requests.exceptions.Timeout, "API call timeout", "Request timeout"),
+    (requests.exceptions.ConnectionError, "Connection error", "Connection error"),
+)
+
+
+def _api_error_category(error: Exception) -> Optional[Tuple[str, str]]:
+    """
+    Get the (log label, error prefix) of a failed API request.
+    
+    Args:
+        error: Exception raised by the session
+    
+    Returns:
+        The matching _API_ERROR_CATEGORIES entry's label and prefix, or None
+        for errors that are not network failures
+    """
+    cause = error.args[0] if error.args else None
+    if isinstance(cause, MaxRetryError) and isinstance(cause.reason, ReadTimeoutError):
+        error = requests.exceptions.ReadTimeout(cause)
+    for exc_type, label, error_prefix in _API_ERROR_CATEGORIES:
+        if isinstance(error, exc_type):
+            return label, error_prefix
+    return None
+
+# Characters of the response body kept in API test results
+RESPONSE_PREVIEW_CHARS = 500
+
+
+def _read_body_preview(response: requests.Response, limit: int = RESPONSE_PREVIEW_CHARS) -> str:
+    """
+    Read the first `limit` characters of a streamed response body and close it.
+    
+    At most 4 bytes per character (the UTF-8 maximum) are read. Small bodies are
+    read to the end, so the connection goes back to the pool; a larger body is
+    dropped after the preview instead of being downloaded.
+    
+    Args:
+        response: Response requested with stream=True
+        limit: Maximum number of characters to keep
+    
+    Returns:
+        Decoded preview (empty if the body is empty or could not be read)
+    """
+    max_bytes = limit * 4
+    preview = b''
+    try:
+        for chunk in response.iter_content(chunk_size=max_bytes):
+            preview += chunk
+            if len(preview) >= max_bytes:
+                break
+    except requests.exceptions.RequestException:
+        pass
+    finally:
+        response.close()
+    return preview[:max_bytes].decode(response.encoding or 'utf-8', errors='replace')[:limit]
+
+
+def _backoff_seconds(attempt: int) -> int:
+    """Seconds to wait before retrying after the given (0-based) attempt."""
+    return _BACKOFF_SECONDS[attempt] if attempt < len(_BACKOFF_SECONDS) else 2 ** attempt
+
+
+def _jittered_backoff(attempt: int, deadline: float) -> float:
+    """
+    Backoff before the next retry, with up to 25% random jitter.
+    
+    Args:
+        attempt: 0-based attempt that just failed
+        deadline: time.monotonic() value by which retrying must stop
+    
+    Returns:
+        Seconds to wait, capped at the time left (<= 0 once the deadline has passed)
+    """
+    backoff = _backoff_seconds(attempt)
+    return min(backoff + random.uniform(0, 0.25 * backoff), deadline - time.monotonic())
+
+
+def _log_endpoint_info(endpoint_data: Any):
+    """DEBUG trace of the endpoints found by a consultation (first 3 shown)."""
+    if isinstance(endpoint_data, list) and endpoint_data:
+        logger.debug("Endpoints found: %d", len(endpoint_data))
+        for i, ep in enumerate(endpoint_data[:3]):
+            logger.debug("  [%d] %s %s", i + 1, ep.get('method', 'N/A'), ep.get('path', 'N/A'))
+    else:
+        logger.debug("Endpoint info: %s", endpoint_data)
+
+
+# Task descriptions are parsed several times per execution (consultation context,
+# API/customer dispatch) and repeat across runs, so the parses are memoized
+@functools.lru_cache(maxsize=256)
+def _description_keywords(description: str) -> FrozenSet[str]:
+    """Context keywords (see _CONTEXT_KEYWORD_PATTERN) found in a task description."""
+    return frozenset(_CONTEXT_KEYWORD_PATTERN.findall(description.lower()))
+
+
+@functools.lru_cache(maxsize=256)
+def _description_endpoint(description: str) -> Optional[str]:
+    """First endpoint URL or path found in a task description."""
+    match = _ENDPOINT_PATTERN.search(description)
+    return match.group(0) if match else None
+
+
+def _index_expert_endpoints(expert_info: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Map HTTP method -> path for the endpoints reported by PhoenixExpert.
+    
+    Args:
+        expert_info: 'information' section of the consultation response
+    
+    Returns:
+        Dictionary keyed by upper-case method; the first endpoint listed for a
+        method wins and a missing path defaults to /api/customer
+    """
+    index: Dict[str, str] = {}
+    endpoints = expert_info.get('endpoint')
+    if isinstance(endpoints, list):
+        for ep in endpoints:
+            if isinstance(ep, dict) and ep.get('method'):
+                index.setdefault(ep['method'].upper(), ep.get('path', '/api/customer'))
+    return index
+
+
+# Consultation 'information' key -> DEBUG trace of its value
+_INFO_HANDLERS: Dict[str, Callable[[Any], None]] = {
+    'endpoint': _log_endpoint_info,
+    'domain': lambda domain: logger.debug("Domain info: %s", domain),
+    'controller': lambda controller: logger.debug("Controller info: %s", controller),
+}
+
 
 class TestType(Enum):
     """Supported test types."""
@@ -82,6 +405,62 @@ class TestStatus(Enum):
     RUNNING = "running"
 
 
+# Status strings as stored in results and records (enum member .value lookups
+# are comparatively slow on the per-result path)
+_STATUS_PASSED = TestStatus.PASSED.value
+_STATUS_FAILED = TestStatus.FAILED.value
+_STATUS_SKIPPED = TestStatus.SKIPPED.value
+_STATUS_ERROR = TestStatus.ERROR.value
+_STATUS_RUNNING = TestStatus.RUNNING.value
+
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a regular dataclass
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ExecutionRecord:
+    """Record of one execute_task() run (kept in the agent's execution history)."""
+    execution_id: str
+    task_description: str
+    test_type: str
+    status: str
+    start_time: str
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    summary: Dict[str, Any] = field(default_factory=dict)
+    agent_consultation: Optional[Dict[str, Any]] = None
+    integration_updates: Optional[Dict[str, Any]] = None
+    end_time: Optional[str] = None
+    error: Optional[str] = None
+    duration_ms: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to the dictionary form returned by execute_task() and saved in reports.
+        
+        Nested results/payloads are shared, not copied; 'error' is only present
+        when the run failed with an exception.
+        """
+        record = {f.name: getattr(self, f.name) for f in fields(self)}
+        if self.error is None:
+            del record['error']
+        return record
+
+
+# Keyword -> (priority, test type), so one pass over the tokens finds every
+# group hit; the lowest priority number wins when several groups match
+_KEYWORD_TEST_TYPES: Dict[str, Tuple[int, TestType]] = {
+    keyword: (priority, test_type)
+    for priority, (test_type, keywords) in enumerate((
+        (TestType.API, _API_KEYWORDS),
+        (TestType.UI, _UI_KEYWORDS),
+        (TestType.INTEGRATION, _INTEGRATION_KEYWORDS),
+        (TestType.E2E, _E2E_KEYWORDS),
+    ))
+    for keyword in keywords
+}
+
+
 class TestAgent:
     """
     Automated testing agent that receives tasks and executes them.
@@ -105,23 +484,56 @@ class TestAgent:
         self.test_cases_dir = base_dir / "test_cases"
         self.test_cases_dir.mkdir(exist_ok=True)
         
-        # Test execution history
-        self.execution_history: List[Dict[str, Any]] = []
+        # Test execution history (most recent 'history_limit' runs; older ones
+        # remain in the JSONL reports)
+        self.execution_history: Deque[ExecutionRecord] = deque(maxlen=self.config.get('history_limit', 256))
+        
+        # Execution reports are written by a background thread (started on first use)
+        # so disk I/O stays out of execute_task; items are (path, payload, append)
+        # tuples or flush events
+        self._report_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._report_writer: Optional[threading.Thread] = None
+        self._report_writer_lock = threading.Lock()
+        
+        # Test type -> executor (anything unmapped runs as a custom test)
+        self._test_executors: Dict[TestType, Callable[..., List[Dict[str, Any]]]] = {
+            TestType.API: self._execute_api_test,
+            TestType.UI: self._execute_ui_test,
+            TestType.INTEGRATION: self._execute_integration_test,
+            TestType.E2E: self._execute_e2e_test,
+            TestType.CUSTOM: self._execute_custom_test,
+        }
         
-        # Initialize agent registry if available
-        self.agent_registry = None
+        # Postman collection listing as (directory, directory mtime_ns, [(name tokens, path)]),
+        # rescanned only when the directory changes
+        self._postman_listing: Optional[Tuple[Path, int, List[Tuple[FrozenSet[str], Path]]]] = None
+        
+        # Shared HTTP session so API tests reuse connections (keep-alive); the
+        # pool is sized for the parallel test workers. The adapter retries
+        # connection errors, timeouts and 5xx responses with exponential backoff
+        # (any method, like the previous hand-written retry loop).
+        pool_size = max(self.config.get('parallel_workers', 8), 1)
+        self._api_retries = self.config.get('api_retries', 2)
+        retry = Retry(
+            total=self._api_retries,
+            backoff_factor=1,
+            status_forcelist=_RETRYABLE_STATUS_CODES,
+            allowed_methods=None,
+            raise_on_status=False
+        )
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # Agent registry, Postman generator and reporting service are
+        # initialized lazily on first use (see the properties below)
         self.consultation_enabled = self.config.get('enable_agent_consultation', True)
-        if AGENT_REGISTRY_AVAILABLE and self.consultation_enabled:
-            try:
-                self.agent_registry = get_agent_registry()
-                # Register PhoenixExpert adapter
-                phoenix_adapter = PhoenixExpertAdapter()
-                self.agent_registry.register_agent(phoenix_adapter)
-                print("TestAgent: Agent consultation enabled")
-                print(f"TestAgent: Registered agents: {', '.join(self.agent_registry.list_agents())}")
-            except Exception as e:
-                print(f"TestAgent: Failed to initialize agent registry: {str(e)}")
-                self.consultation_enabled = False
+        
+        # (task_description, test_type) -> (timestamp, successful consultation result),
+        # least recently used first; entries expire after 'consultation_cache_ttl_s'
+        self._consult_cache: OrderedDict = OrderedDict()
+        self._consult_cache_ttl = self.config.get('consultation_cache_ttl_s', 300)
         
         # Initialize integration service (GitLab/Jira) - CRITICAL: All agents must use this
         self.integration_service = None
@@ -139,26 +551,8 @@ class TestAgent:
             if not self.integration_enabled:
                 print("TestAgent: ⚠ Integration updates disabled in configuration")
         
-        # Initialize Postman collection generator
-        self.postman_generator = None
-        if POSTMAN_GENERATOR_AVAILABLE:
-            try:
-                self.postman_generator = get_postman_collection_generator(self.config)
-                print("TestAgent: Postman collection generator enabled")
-            except Exception as e:
-                print(f"TestAgent: Failed to initialize Postman generator: {str(e)}")
-        
-        # Initialize reporting service
-        self.reporting_service = None
         self.reporting_enabled = self.config.get('enable_reporting', True)
-        if REPORTING_SERVICE_AVAILABLE and self.reporting_enabled:
-            try:
-                self.reporting_service = get_reporting_service()
-                print("TestAgent: Reporting service enabled")
-            except Exception as e:
-                print(f"TestAgent: Failed to initialize reporting service: {str(e)}")
-                self.reporting_enabled = False
-        else:
+        if not (REPORTING_SERVICE_AVAILABLE and self.reporting_enabled):
             if not REPORTING_SERVICE_AVAILABLE:
                 print("TestAgent: ⚠ Reporting service not available")
             if not self.reporting_enabled:
@@ -168,6 +562,51 @@ class TestAgent:
         print(f"TestAgent: Base URL set to {self.base_url}")
         print("TestAgent: Ready to execute test tasks")
     
+    @functools.cached_property
+    def agent_registry(self):
+        """Agent registry with the PhoenixExpert adapter registered (None if unavailable)."""
+        if not (AGENT_REGISTRY_AVAILABLE and self.consultation_enabled):
+            return None
+        try:
+            agent_registry = get_agent_registry()
+            # Register PhoenixExpert adapter
+            phoenix_adapter = PhoenixExpertAdapter()
+            agent_registry.register_agent(phoenix_adapter)
+            print("TestAgent: Agent consultation enabled")
+            print(f"TestAgent: Registered agents: {', '.join(agent_registry.list_agents())}")
+            return agent_registry
+        except Exception as e:
+            print(f"TestAgent: Failed to initialize agent registry: {str(e)}")
+            self.consultation_enabled = False
+            return None
+    
+    @functools.cached_property
+    def postman_generator(self):
+        """Postman collection generator (None if unavailable)."""
+        if not POSTMAN_GENERATOR_AVAILABLE:
+            return None
+        try:
+            postman_generator = get_postman_collection_generator(self.config)
+            print("TestAgent: Postman collection generator enabled")
+            return postman_generator
+        except Exception as e:
+            print(f"TestAgent: Failed to initialize Postman generator: {str(e)}")
+            return None
+    
+    @functools.cached_property
+    def reporting_service(self):
+        """Reporting service (None if unavailable or disabled)."""
+        if not (REPORTING_SERVICE_AVAILABLE and self.reporting_enabled):
+            return None
+        try:
+            reporting_service = get_reporting_service()
+            print("TestAgent: Reporting service enabled")
+            return reporting_service
+        except Exception as e:
+            print(f"TestAgent: Failed to initialize reporting service: {str(e)}")
+            self.reporting_enabled = False
+            return None
+    
     def execute_task(self, task_description: str, test_type: TestType = None) -> Dict[str, Any]:
         """
         Execute a testing task based on description.
@@ -179,6 +618,12 @@ class TestAgent:
         Returns:
             Dictionary with test execution results
         """
+        # One wall-clock capture names the run; durations use the monotonic clock.
+        # TEST_YYYYmmdd_HHMMSS, formatted from the fields directly (no strftime)
+        now = datetime.now()
+        execution_id = (f"TEST_{now.year:04d}{now.month:02d}{now.day:02d}"
+                        f"_{now.hour:02d}{now.minute:02d}{now.second:02d}")
+        
         print(f"\n{'='*60}")
         print(f"TestAgent: Received task: {task_description}")
         print(f"{'='*60}\n")
@@ -192,34 +637,24 @@ class TestAgent:
         # Consult with other agents - ALWAYS for all tests
         # CRITICAL: Consultation is ALWAYS required per rules
         agent_consultation = None
-        consultation_start_time = datetime.now()
         
         if self.consultation_enabled and self.agent_registry:
             should_consult = self._should_consult_agents(task_description, test_type)
             if should_consult:
-                print("\n" + "="*70)
-                print("TestAgent: [CONSULTATION PROCESS STARTING]")
-                print("="*70)
-                print(f"TestAgent: Task: {task_description}")
-                print(f"TestAgent: Test Type: {test_type.value}")
-                print(f"TestAgent: Consultation Time: {consultation_start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-                print(f"TestAgent: Consulting with PhoenixExpert agent...")
-                print("-"*70)
-                
-                # Extract context before consultation
-                context = self._extract_consultation_context(task_description, test_type)
-                print(f"TestAgent: Extracted Context:")
-                for key, value in context.items():
-                    print(f"  - {key}: {value}")
-                print("-"*70)
+                logger.debug("[CONSULTATION PROCESS STARTING] task=%r, test type=%s, time=%s",
+                             task_description, test_type.value, now)
+                if logger.isEnabledFor(logging.DEBUG):
+                    # Only needed for the trace; _consult_other_agents extracts its own copy
+                    logger.debug("Extracted context: %s",
+                                 self._extract_consultation_context(task_description, test_type))
                 
                 # Perform consultation
+                print("TestAgent: Consulting with PhoenixExpert agent...")
+                consultation_start = time.perf_counter()
                 agent_consultation = self._consult_other_agents(task_description, test_type)
-                consultation_end_time = datetime.now()
-                consultation_duration = (consultation_end_time - consultation_start_time).total_seconds()
+                consultation_duration = time.perf_counter() - consultation_start
                 
                 print(f"TestAgent: Consultation Duration: {consultation_duration:.2f} seconds")
-                print("-"*70)
                 
                 if agent_consultation and agent_consultation.get('success'):
                     print(f"TestAgent: ✓ Successfully consulted with {agent_consultation.get('agent')} agent")
@@ -227,45 +662,8 @@ class TestAgent:
                     consultation_info = agent_consultation.get('response', {})
                     if consultation_info:
                         print(f"TestAgent: ✓ Received information from agent consultation")
-                        print(f"TestAgent: Consultation Response Structure:")
-                        
-                        # Log detailed information received
-                        if 'information' in consultation_info:
-                            info = consultation_info['information']
-                            print(f"  - Information keys: {list(info.keys())}")
-                            
-                            if 'endpoint' in info:
-                                endpoint_data = info['endpoint']
-                                if isinstance(endpoint_data, list) and len(endpoint_data) > 0:
-                                    print(f"  - Endpoints found: {len(endpoint_data)}")
-                                    for i, ep in enumerate(endpoint_data[:3]):  # Show first 3
-                                        print(f"    [{i+1}] {ep.get('method', 'N/A')} {ep.get('path', 'N/A')}")
-                                else:
-                                    print(f"  - Endpoint info: {endpoint_data}")
-                            
-                            if 'domain' in info:
-                                domain_data = info['domain']
-                                print(f"  - Domain info: {domain_data}")
-                            
-                            if 'controller' in info:
-                                controller_data = info['controller']
-                                print(f"  - Controller info: {controller_data}")
-                        
-                        if 'phoenix_answer' in consultation_info:
-                            phoenix_answer = consultation_info['phoenix_answer']
-                            if isinstance(phoenix_answer, dict):
-                                print(f"  - Phoenix Answer: {phoenix_answer.get('answer', 'N/A')[:100]}...")
-                                if 'sources' in phoenix_answer:
-                                    sources = phoenix_answer['sources']
-                                    code_files = sources.get('code', [])
-                                    confluence = sources.get('confluence', [])
-                                    print(f"  - Code files found: {len(code_files)}")
-                                    print(f"  - Confluence pages found: {len(confluence)}")
-                        
-                        if 'sources' in consultation_info:
-                            sources = consultation_info['sources']
-                            print(f"  - Additional sources: {list(sources.keys())}")
-                        
+                        if logger.isEnabledFor(logging.DEBUG):
+                            self._log_consultation_details(consultation_info)
                         print(f"TestAgent: ✓ Consultation information will be used for test execution")
                 elif agent_consultation:
                     print(f"TestAgent: ✗ Consultation completed but returned error")
@@ -275,9 +673,7 @@ class TestAgent:
                 else:
                     print("TestAgent: ✗ Consultation returned no result")
                 
-                print("="*70)
-                print("TestAgent: [CONSULTATION PROCESS COMPLETED]")
-                print("="*70 + "\n")
+                logger.debug("[CONSULTATION PROCESS COMPLETED]")
         else:
             if not self.consultation_enabled:
                 print("TestAgent: ⚠ Consultation is disabled in configuration")
@@ -290,7 +686,7 @@ class TestAgent:
         if self.integration_enabled and self.integration_service:
             try:
                 metadata = {
-                    'execution_id': f"TEST_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
+                    'execution_id': execution_id,
                     'test_type': test_type.value,
                     'base_url': self.base_url
                 }
@@ -311,50 +707,41 @@ class TestAgent:
                     'error': str(e),
                     'success': False
                 }
+        elif not self.integration_enabled:
+            # Disabled implies no service, so one warning is enough
+            print("TestAgent: ⚠ Integration updates are disabled in configuration")
         else:
-            if not self.integration_enabled:
-                print("TestAgent: ⚠ Integration updates are disabled in configuration")
-            if not self.integration_service:
-                print("TestAgent: ⚠ Integration service is not available")
+            print("TestAgent: ⚠ Integration service is not available")
         
         # Create test execution record
-        execution_id = f"TEST_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        execution_record = {
-            'execution_id': execution_id,
-            'task_description': task_description,
-            'test_type': test_type.value,
-            'status': TestStatus.RUNNING.value,
-            'start_time': datetime.now().isoformat(),
-            'results': [],
-            'summary': {},
-            'agent_consultation': agent_consultation,
-            'integration_updates': integration_update_result
-        }
+        execution_start = time.perf_counter()
+        execution_record = ExecutionRecord(
+            execution_id=execution_id,
+            task_description=task_description,
+            test_type=test_type.value,
+            status=_STATUS_RUNNING,
+            start_time=datetime.now().isoformat(),
+            agent_consultation=agent_consultation,
+            integration_updates=integration_update_result
+        )
         
         try:
             # Execute based on test type, pass consultation info
-            if test_type == TestType.API:
-                results = self._execute_api_test(task_description, agent_consultation)
-            elif test_type == TestType.UI:
-                results = self._execute_ui_test(task_description, agent_consultation)
-            elif test_type == TestType.INTEGRATION:
-                results = self._execute_integration_test(task_description, agent_consultation)
-            elif test_type == TestType.E2E:
-                results = self._execute_e2e_test(task_description, agent_consultation)
-            else:
-                results = self._execute_custom_test(task_description, agent_consultation)
+            executor = self._test_executors.get(test_type, self._execute_custom_test)
+            results = executor(task_description, agent_consultation)
             
             # Update execution record
-            execution_record['results'] = results
-            execution_record['status'] = self._determine_overall_status(results)
-            execution_record['end_time'] = datetime.now().isoformat()
-            execution_record['summary'] = self._generate_summary(results)
+            execution_record.results = results
+            execution_record.status = self._determine_overall_status(results)
+            execution_record.end_time = datetime.now().isoformat()
+            execution_record.summary = self._generate_summary(results)
             
         except Exception as e:
-            execution_record['status'] = TestStatus.ERROR.value
-            execution_record['error'] = str(e)
-            execution_record['end_time'] = datetime.now().isoformat()
+            execution_record.status = _STATUS_ERROR
+            execution_record.error = str(e)
+            execution_record.end_time = datetime.now().isoformat()
             print(f"TestAgent: Error executing task - {str(e)}")
+        execution_record.duration_ms = (time.perf_counter() - execution_start) * 1000
         
         # Save execution record
         self.execution_history.append(execution_record)
@@ -363,21 +750,14 @@ class TestAgent:
         # Log to reporting service
         if self.reporting_enabled and self.reporting_service:
             try:
-                duration_ms = 0
-                if 'start_time' in execution_record and 'end_time' in execution_record:
-                    from datetime import datetime
-                    start = datetime.fromisoformat(execution_record['start_time'])
-                    end = datetime.fromisoformat(execution_record['end_time'])
-                    duration_ms = (end - start).total_seconds() * 1000
-                
                 self.reporting_service.log_task_execution(
                     agent_name="TestAgent",
                     task=task_description,
                     task_type=test_type.value,
-                    success=execution_record['status'] == TestStatus.PASSED.value,
-                    duration_ms=duration_ms,
-                    result=execution_record.get('summary', {}),
-                    execution_id=execution_record.get('execution_id'),
+                    success=execution_record.status == _STATUS_PASSED,
+                    duration_ms=execution_record.duration_ms,
+                    result=execution_record.summary,
+                    execution_id=execution_record.execution_id,
                     test_type=test_type.value
                 )
                 
@@ -386,19 +766,39 @@ class TestAgent:
             except Exception as e:
                 print(f"TestAgent: ⚠ Failed to log to reporting service: {str(e)}")
         
-        return execution_record
+        return execution_record.to_dict()
+    
+    def _log_consultation_details(self, consultation_info: Dict[str, Any]):
+        """Trace the structure of a consultation response (DEBUG level)."""
+        info = consultation_info.get('information')
+        if info:
+            logger.debug("Information keys: %s", list(info))
+            for key, value in info.items():
+                handler = _INFO_HANDLERS.get(key)
+                if handler:
+                    handler(value)
+        
+        phoenix_answer = consultation_info.get('phoenix_answer')
+        if isinstance(phoenix_answer, dict):
+            logger.debug("Phoenix Answer: %.100s...", phoenix_answer.get('answer', 'N/A'))
+            sources = phoenix_answer.get('sources')
+            if sources is not None:
+                logger.debug("Code files found: %d", len(sources.get('code', ())))
+                logger.debug("Confluence pages found: %d", len(sources.get('confluence', ())))
+        
+        sources = consultation_info.get('sources')
+        if sources is not None:
+            logger.debug("Additional sources: %s", list(sources))
     
     def _detect_test_type(self, task_description: str) -> TestType:
         """Auto-detect test type from task description."""
         description_lower = task_description.lower()
+        hits = [_KEYWORD_TEST_TYPES[token] for token in _TOKEN_PATTERN.findall(description_lower)
+                if token in _KEYWORD_TEST_TYPES]
         
-        if any(keyword in description_lower for keyword in ['api', 'endpoint', 'rest', 'postman', 'http', 'request']):
-            return TestType.API
-        elif any(keyword in description_lower for keyword in ['ui', 'browser', 'playwright', 'selenium', 'page', 'click', 'navigate']):
-            return TestType.UI
-        elif any(keyword in description_lower for keyword in ['integration', 'service', 'component']):
-            return TestType.INTEGRATION
-        elif any(keyword in description_lower for keyword in ['e2e', 'end-to-end', 'full flow', 'complete flow']):
+        if hits:
+            return min(hits, key=lambda hit: hit[0])[1]
+        elif any(phrase in description_lower for phrase in _E2E_PHRASES):
             return TestType.E2E
         else:
             return TestType.CUSTOM
@@ -422,6 +822,11 @@ class TestAgent:
         4. PhoenixExpert searches codebase and Confluence
         5. Returns structured information about endpoints, validations, permissions
         
+        Retries back off exponentially with jitter and stop early once the overall
+        budget (config 'consultation_budget_s', default 15 seconds) is used up.
+        Successful results are reused for the same task and test type for
+        'consultation_cache_ttl_s' seconds (default 300; 0 disables the cache).
+        
         Args:
             task_description: Task description
             test_type: Detected test type
@@ -452,27 +857,29 @@ class TestAgent:
                 'retry_count': 0
             }
         
+        cache_key = (task_description, test_type.value)
+        cached = self._consult_cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < self._consult_cache_ttl:
+                self._consult_cache.move_to_end(cache_key)
+                print("TestAgent: Using cached consultation result for this task")
+                return dict(cached[1], retry_count=0)
+            del self._consult_cache[cache_key]
+        
         last_exception = None
         consultation_result = None
+        budget = self.config.get('consultation_budget_s', 15)
+        deadline = time.monotonic() + budget
+        attempt = 0
+        
+        # Step 1: Extract context for consultation (same for every attempt)
+        context = self._extract_consultation_context(task_description, test_type)
         
         for attempt in range(max_retries + 1):
             try:
-                # Step 1: Extract context for consultation
-                if attempt == 0:
-                    print("TestAgent: [Step 1/3] Extracting consultation context...")
-                else:
-                    print(f"TestAgent: [Retry {attempt}/{max_retries}] Extracting consultation context...")
-                
-                context = self._extract_consultation_context(task_description, test_type)
-                
                 # Step 2: Consult with best matching agent
-                if attempt == 0:
-                    print("TestAgent: [Step 2/3] Sending consultation request to AgentRegistry...")
-                else:
-                    print(f"TestAgent: [Retry {attempt}/{max_retries}] Sending consultation request...")
-                
-                print(f"TestAgent: Query: {task_description[:100]}...")
-                print(f"TestAgent: Context keys: {list(context.keys())}")
+                logger.debug("[Attempt %d/%d] Sending consultation request to AgentRegistry (query: %.100s, context keys: %s)",
+                             attempt + 1, max_retries + 1, task_description, list(context))
                 
                 # Use timeout from config or default
                 timeout = self.config.get('consultation_timeout', 30)
@@ -483,21 +890,20 @@ class TestAgent:
                 )
                 
                 # Step 3: Process consultation result
-                if attempt == 0:
-                    print("TestAgent: [Step 3/3] Processing consultation response...")
-                else:
-                    print(f"TestAgent: [Retry {attempt}/{max_retries}] Processing consultation response...")
+                logger.debug("[Attempt %d/%d] Processing consultation response...", attempt + 1, max_retries + 1)
                 
                 if consultation_result:
                     if consultation_result.get('success'):
-                        print(f"TestAgent: ✓ Consultation successful")
-                        agent_name = consultation_result.get('agent', 'Unknown')
-                        print(f"TestAgent: Agent used: {agent_name}")
-                        if 'duration_ms' in consultation_result:
-                            print(f"TestAgent: Consultation duration: {consultation_result['duration_ms']:.2f}ms")
+                        logger.debug("Consultation successful (agent: %s, duration: %s ms)",
+                                     consultation_result.get('agent', 'Unknown'), consultation_result.get('duration_ms'))
                         
                         # Add retry count to result
                         consultation_result['retry_count'] = attempt
+                        if self._consult_cache_ttl > 0:
+                            self._consult_cache[cache_key] = (time.monotonic(), consultation_result)
+                            self._consult_cache.move_to_end(cache_key)
+                            while len(self._consult_cache) > CONSULTATION_CACHE_SIZE:
+                                self._consult_cache.popitem(last=False)
                         return consultation_result
                     else:
                         error = consultation_result.get('error', 'Unknown error')
@@ -505,9 +911,10 @@ class TestAgent:
                         
                         # Check if error is retryable
                         if attempt < max_retries and self._is_retryable_error(error):
-                            wait_time = 2 ** attempt  # Exponential backoff
-                            print(f"TestAgent: Retryable error detected. Retrying in {wait_time} seconds...")
-                            import time
+                            wait_time = _jittered_backoff(attempt, deadline)
+                            if wait_time <= 0:
+                                break
+                            print(f"TestAgent: Retryable error detected. Retrying in {wait_time:.1f} seconds...")
                             time.sleep(wait_time)
                             continue
                         else:
@@ -517,9 +924,10 @@ class TestAgent:
                 else:
                     print("TestAgent: ✗ Consultation returned None")
                     if attempt < max_retries:
-                        wait_time = 2 ** attempt
-                        print(f"TestAgent: Retrying in {wait_time} seconds...")
-                        import time
+                        wait_time = _jittered_backoff(attempt, deadline)
+                        if wait_time <= 0:
+                            break
+                        print(f"TestAgent: Retrying in {wait_time:.1f} seconds...")
                         time.sleep(wait_time)
                         continue
                     else:
@@ -533,9 +941,10 @@ class TestAgent:
                 last_exception = e
                 print(f"TestAgent: ✗ Consultation timeout: {str(e)}")
                 if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    print(f"TestAgent: Retrying after timeout in {wait_time} seconds...")
-                    import time
+                    wait_time = _jittered_backoff(attempt, deadline)
+                    if wait_time <= 0:
+                        break
+                    print(f"TestAgent: Retrying after timeout in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -548,13 +957,14 @@ class TestAgent:
             except Exception as e:
                 last_exception = e
                 print(f"TestAgent: ✗ Exception during consultation: {str(e)}")
-                import traceback
-                print(f"TestAgent: Traceback: {traceback.format_exc()}")
+                # Traceback is only formatted if DEBUG logging is enabled
+                logger.debug("Consultation exception traceback", exc_info=True)
                 
                 if attempt < max_retries and self._is_retryable_error(str(e)):
-                    wait_time = 2 ** attempt
-                    print(f"TestAgent: Retryable exception. Retrying in {wait_time} seconds...")
-                    import time
+                    wait_time = _jittered_backoff(attempt, deadline)
+                    if wait_time <= 0:
+                        break
+                    print(f"TestAgent: Retryable exception. Retrying in {wait_time:.1f} seconds...")
                     time.sleep(wait_time)
                     continue
                 else:
@@ -565,12 +975,13 @@ class TestAgent:
                         'exception_type': type(e).__name__
                     }
         
-        # All retries failed
+        # Retry budget exhausted before the last attempt
+        print(f"TestAgent: ✗ Consultation retry budget ({budget}s) exhausted")
         return {
             'success': False,
-            'error': f'Consultation failed after {max_retries + 1} attempts',
+            'error': f'Consultation retry budget ({budget}s) exhausted after {attempt + 1} attempts',
             'last_exception': str(last_exception) if last_exception else None,
-            'retry_count': max_retries
+            'retry_count': attempt
         }
     
     def _is_retryable_error(self, error: str) -> bool:
@@ -583,46 +994,10 @@ class TestAgent:
         Returns:
             True if error is retryable, False otherwise
         """
-        error_lower = error.lower()
-        
-        # Retryable errors
-        retryable_patterns = [
-            'timeout',
-            'connection',
-            'network',
-            'temporary',
-            'unavailable',
-            'rate limit',
-            'too many requests',
-            'service unavailable',
-            '502',
-            '503',
-            '504'
-        ]
-        
-        # Non-retryable errors
-        non_retryable_patterns = [
-            'not found',
-            '404',
-            'unauthorized',
-            '403',
-            'forbidden',
-            'invalid',
-            'bad request',
-            '400',
-            'authentication failed'
-        ]
-        
-        # Check non-retryable first
-        if any(pattern in error_lower for pattern in non_retryable_patterns):
-            return False
-        
-        # Check retryable
-        if any(pattern in error_lower for pattern in retryable_patterns):
-            return True
-        
-        # Default: retry for unknown errors (might be transient)
-        return True
+        # Non-retryable errors take precedence; known transient errors
+        # (timeouts, connection/network issues, rate limits, 502/503/504) and
+        # unknown errors (might be transient) are retried
+        return not _NON_RETRYABLE_ERROR_PATTERN.search(error.lower())
     
     def _should_consult_agents(self, task_description: str, test_type: TestType) -> bool:
         """
@@ -639,7 +1014,7 @@ class TestAgent:
             True - ALWAYS consult with PhoenixExpert for any test
         """
         # ALWAYS consult with PhoenixExpert for any test
-        print("TestAgent: Consultation rule - ALWAYS consulting PhoenixExpert for all tests")
+        logger.debug("Consultation rule - ALWAYS consulting PhoenixExpert for all tests")
         return True
     
     def _extract_consultation_context(self, task_description: str, test_type: TestType) -> Dict[str, Any]:
@@ -664,74 +1039,68 @@ class TestAgent:
             'base_url': self.base_url
         }
         
-        description_lower = task_description.lower()
+        keywords = _description_keywords(task_description)
         
         # Extract endpoint if present
         endpoint = self._extract_endpoint(task_description)
         if endpoint:
             context['endpoint_path'] = endpoint
             context['method'] = self._extract_method(task_description)
-        else:
-            # Try to infer customer endpoint from description
-            if 'customer' in description_lower:
-                if 'create' in description_lower or 'post' in description_lower:
-                    context['endpoint_path'] = '/api/customer'
-                    context['method'] = 'POST'
-                elif 'edit' in description_lower or 'update' in description_lower or 'put' in description_lower:
-                    context['endpoint_path'] = '/api/customer'
-                    context['method'] = 'PUT'
-                elif 'view' in description_lower or 'get' in description_lower:
-                    context['endpoint_path'] = '/api/customer'
-                    context['method'] = 'GET'
-                elif 'delete' in description_lower:
-                    context['endpoint_path'] = '/api/customer'
-                    context['method'] = 'DELETE'
+        
+        operation = self._customer_operation(keywords) if 'customer' in keywords else None
+        if not endpoint and operation in _OPERATION_METHODS:
+            # Infer customer endpoint from the operation
+            context['endpoint_path'] = '/api/customer'
+            context['method'] = _OPERATION_METHODS[operation]
         
         # Extract domain/controller - customer domain is always 'customer'
-        if 'customer' in description_lower:
+        if 'customer' in keywords:
             context['domain'] = 'customer'
             context['controller'] = 'customer-controller'
         
         # Try to extract domain/controller from description for other cases
-        if 'domain' in description_lower:
-            import re
-            domain_match = re.search(r'(\w+)\s+domain', description_lower)
-            if domain_match:
-                context['domain'] = domain_match.group(1)
-        
-        if 'controller' in description_lower:
-            import re
-            controller_match = re.search(r'(\w+)\s+controller', description_lower)
-            if controller_match:
-                context['controller'] = controller_match.group(1)
-        
-        # Extract operation type for customer tests
-        if 'customer' in description_lower:
-            if 'create' in description_lower:
-                context['operation'] = 'create'
-            elif 'edit' in description_lower or 'update' in description_lower:
-                context['operation'] = 'edit'
-            elif 'view' in description_lower or 'get' in description_lower:
-                context['operation'] = 'view'
-            elif 'delete' in description_lower:
-                context['operation'] = 'delete'
-            elif 'validation' in description_lower:
-                context['operation'] = 'validation'
-            elif 'permission' in description_lower:
-                context['operation'] = 'permission'
+        if 'domain' in keywords or 'controller' in keywords:
+            description_lower = task_description.lower()
+            if 'domain' in keywords:
+                domain_match = _DOMAIN_HINT_PATTERN.search(description_lower)
+                if domain_match:
+                    context['domain'] = domain_match.group(1)
+            
+            if 'controller' in keywords:
+                controller_match = _CONTROLLER_HINT_PATTERN.search(description_lower)
+                if controller_match:
+                    context['controller'] = controller_match.group(1)
+        
+        # Operation type for customer tests
+        if operation:
+            context['operation'] = operation
         
         return context
     
+    @staticmethod
+    def _customer_operation(keywords: FrozenSet[str]) -> Optional[str]:
+        """
+        Map context keywords to a customer test operation.
+        
+        Args:
+            keywords: Context keywords found in the description
+        
+        Returns:
+            Operation name (create/edit/view/delete/validation/permission) or None
+        """
+        for operation, words in _CUSTOMER_OPERATIONS:
+            if not keywords.isdisjoint(words):
+                return operation
+        return None
+    
     def _execute_api_test(self, task_description: str, agent_consultation: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Execute API test based on task description."""
         results = []
         
         print("TestAgent: Executing API test...")
         
-        description_lower = task_description.lower()
-        
         # Check if this is a customer test
-        if 'customer' in description_lower:
+        if 'customer' in _description_keywords(task_description):
             # Execute customer-specific tests
             customer_results = self._execute_customer_tests(task_description, agent_consultation)
             results.extend(customer_results)
@@ -745,7 +1114,7 @@ class TestAgent:
         if not endpoint and agent_consultation and agent_consultation.get('success'):
             consultation_info = agent_consultation.get('response', {}).get('information', {})
             endpoint_info = consultation_info.get('endpoint')
-            if endpoint_info and isinstance(endpoint_info, list) and len(endpoint_info) > 0:
+            if isinstance(endpoint_info, list) and endpoint_info:
                 endpoint = endpoint_info[0].get('path')
                 if not method:
                     method = endpoint_info[0].get('method', 'GET')
@@ -819,7 +1188,7 @@ class TestAgent:
         result = {
             'test_name': 'Custom Test',
             'description': task_description,
-            'status': TestStatus.SKIPPED.value,
+            'status': _STATUS_SKIPPED,
             'message': 'Custom test execution not yet implemented',
             'timestamp': datetime.now().isoformat()
         }
@@ -829,27 +1198,23 @@ class TestAgent:
     
     def _extract_endpoint(self, description: str) -> Optional[str]:
         """Extract endpoint URL from description."""
-        # Simple extraction - look for URL patterns
-        import re
-        url_pattern = r'https?://[^\s]+|/[a-zA-Z0-9/_-]+'
-        matches = re.findall(url_pattern, description)
-        if matches:
-            return matches[0]
-        return None
+        # Simple extraction - look for URL patterns (memoized per description)
+        return _description_endpoint(description)
     
     def _extract_method(self, description: str) -> str:
-        """Extract HTTP method from description."""
-        description_lower = description.lower()
-        if 'get' in description_lower:
-            return 'GET'
-        elif 'post' in description_lower:
-            return 'POST'
-        elif 'put' in description_lower:
-            return 'PUT'
-        elif 'delete' in description_lower:
-            return 'DELETE'
-        elif 'patch' in description_lower:
-            return 'PATCH'
+        """
+        Extract HTTP method from description.
+        
+        Args:
+            description: Task description
+        
+        Returns:
+            HTTP method (GET if none is mentioned)
+        """
+        keywords = _description_keywords(description)
+        for method in _HTTP_METHODS:
+            if method in keywords:
+                return method.upper()
         return 'GET'
     
     def _execute_api_call(
@@ -857,18 +1222,20 @@ class TestAgent:
         endpoint: str, 
         method: str = 'GET', 
         data: Dict = None,
-        timeout: int = None,
-        max_retries: int = 2
+        timeout: int = None
     ) -> Dict[str, Any]:
         """
-        Execute a single API call with improved error handling and retry logic.
+        Execute a single API call.
+        
+        Connection errors, timeouts and 500/502/503/504 responses are retried
+        with exponential backoff by the session's adapter (config 'api_retries',
+        default 2); the last response or error is reported.
         
         Args:
             endpoint: API endpoint URL
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             data: Request body data (for POST/PUT)
             timeout: Request timeout in seconds (uses config default if not provided)
-            max_retries: Maximum number of retry attempts (default: 2)
         
         Returns:
             Test result dictionary
@@ -876,120 +1243,85 @@ class TestAgent:
         timeout = timeout or self.config.get('api_timeout', 30)
         url = endpoint if endpoint.startswith('http') else f"{self.base_url}{endpoint}"
         
-        last_exception = None
-        
-        for attempt in range(max_retries + 1):
-            try:
-                if attempt > 0:
-                    print(f"TestAgent: Retrying API call (attempt {attempt + 1}/{max_retries + 1})...")
-                else:
-                    print(f"TestAgent: Executing {method} {url}")
-                
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    json=data,
-                    timeout=timeout
-                )
-                
-                result = {
+        print(f"TestAgent: Executing {method} {url}")
+        try:
+            response = self._session.request(
+                method=method,
+                url=url,
+                json=data,
+                timeout=timeout,
+                stream=True
+            )
+        except Exception as e:
+            category = _api_error_category(e)
+            if category is None:
+                # Not a network failure, so the adapter did not retry it
+                print(f"TestAgent: API call error: {str(e)}")
+                return {
                     'test_name': f'{method} {endpoint}',
-                    'status': TestStatus.PASSED.value if response.status_code < 400 else TestStatus.FAILED.value,
+                    'status': _STATUS_ERROR,
                     'endpoint': endpoint,
                     'method': method,
-                    'status_code': response.status_code,
-                    'response_time_ms': response.elapsed.total_seconds() * 1000,
-                    'response_body': response.text[:500] if response.text else None,
+                    'error': f'Error: {str(e)}',
                     'timestamp': datetime.now().isoformat(),
-                    'retry_count': attempt
+                    'retry_count': 0,
+                    'exception_type': type(e).__name__
                 }
-                
-                if response.status_code >= 400:
-                    result['error'] = f"HTTP {response.status_code}: {response.text[:200]}"
-                    
-                    # Check if status code is retryable
-                    if attempt < max_retries and response.status_code in [500, 502, 503, 504]:
-                        wait_time = 2 ** attempt
-                        print(f"TestAgent: Server error {response.status_code}. Retrying in {wait_time} seconds...")
-                        import time
-                        time.sleep(wait_time)
-                        continue
-                
-                print(f"TestAgent: API call completed - Status: {result['status']}, Code: {response.status_code}")
-                return result
-                
-            except requests.exceptions.Timeout as e:
-                last_exception = e
-                print(f"TestAgent: API call timeout: {str(e)}")
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    print(f"TestAgent: Retrying after timeout in {wait_time} seconds...")
-                    import time
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    return {
-                        'test_name': f'{method} {endpoint}',
-                        'status': TestStatus.ERROR.value,
-                        'endpoint': endpoint,
-                        'method': method,
-                        'error': f'Request timeout after {max_retries + 1} attempts: {str(e)}',
-                        'timestamp': datetime.now().isoformat(),
-                        'retry_count': attempt
-                    }
-                    
-            except requests.exceptions.ConnectionError as e:
-                last_exception = e
-                print(f"TestAgent: Connection error: {str(e)}")
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    print(f"TestAgent: Retrying connection in {wait_time} seconds...")
-                    import time
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    return {
-                        'test_name': f'{method} {endpoint}',
-                        'status': TestStatus.ERROR.value,
-                        'endpoint': endpoint,
-                        'method': method,
-                        'error': f'Connection error after {max_retries + 1} attempts: {str(e)}',
-                        'timestamp': datetime.now().isoformat(),
-                        'retry_count': attempt
-                    }
-                    
-            except Exception as e:
-                last_exception = e
-                print(f"TestAgent: API call error: {str(e)}")
-                if attempt < max_retries:
-                    wait_time = 2 ** attempt
-                    print(f"TestAgent: Retrying in {wait_time} seconds...")
-                    import time
-                    time.sleep(wait_time)
-                    continue
-                else:
-                    return {
-                        'test_name': f'{method} {endpoint}',
-                        'status': TestStatus.ERROR.value,
-                        'endpoint': endpoint,
-                        'method': method,
-                        'error': f'Error after {max_retries + 1} attempts: {str(e)}',
-                        'timestamp': datetime.now().isoformat(),
-                        'retry_count': attempt,
-                        'exception_type': type(e).__name__
-                    }
+            
+            label, error_prefix = category
+            print(f"TestAgent: {label}: {str(e)}")
+            return {
+                'test_name': f'{method} {endpoint}',
+                'status': _STATUS_ERROR,
+                'endpoint': endpoint,
+                'method': method,
+                'error': f'{error_prefix} after {self._api_retries + 1} attempts: {str(e)}',
+                'timestamp': datetime.now().isoformat(),
+                'retry_count': self._api_retries
+            }
         
-        # All retries failed
-        return {
+        retries = getattr(response.raw, 'retries', None)
+        retry_count = len(retries.history) if retries is not None else 0
+        if retry_count:
+            print(f"TestAgent: API call retried {retry_count} time(s)")
+        
+        # Only the start of the body is kept, so only that much is read
+        body_preview = _read_body_preview(response)
+        
+        result = {
             'test_name': f'{method} {endpoint}',
-            'status': TestStatus.ERROR.value,
+            'status': _STATUS_PASSED if response.status_code < 400 else _STATUS_FAILED,
             'endpoint': endpoint,
             'method': method,
-            'error': f'API call failed after {max_retries + 1} attempts',
-            'last_exception': str(last_exception) if last_exception else None,
+            'status_code': response.status_code,
+            'response_time_ms': response.elapsed.total_seconds() * 1000,
+            'response_body': body_preview or None,
             'timestamp': datetime.now().isoformat(),
-            'retry_count': max_retries
+            'retry_count': retry_count
         }
+        
+        if response.status_code >= 400:
+            result['error'] = f"HTTP {response.status_code}: {body_preview[:200]}"
+        
+        print(f"TestAgent: API call completed - Status: {result['status']}, Code: {response.status_code}")
+        return result
+    
+    def _run_in_parallel(self, tests: List[Callable[[], Any]]) -> List[Any]:
+        """
+        Run independent (I/O-bound) tests concurrently.
+        
+        Args:
+            tests: Zero-argument callables, e.g. functools.partial over a test method
+        
+        Returns:
+            Results in the same order as tests
+        """
+        workers = min(self.config.get('parallel_workers', 8), len(tests))
+        if workers <= 1:
+            return [test() for test in tests]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(test) for test in tests]
+            return [future.result() for future in futures]
     
     def _find_postman_collection(self, description: str) -> Optional[Path]:
         """Find Postman collection matching description."""
@@ -1000,12 +1332,36 @@ class TestAgent:
             # Fallback to old location if exists
             postman_dir = base_dir / "postman_collections"
         if postman_dir.exists():
-            for collection_file in postman_dir.glob("*.json"):
-                # Simple matching - could be improved
-                if any(keyword in collection_file.name.lower() for keyword in description.lower().split()):
+            keywords = frozenset(_TOKEN_PATTERN.findall(description.lower()))
+            for name_tokens, collection_file in self._list_postman_collections(postman_dir):
+                # First collection sharing a whole word with the description
+                if not keywords.isdisjoint(name_tokens):
                     return collection_file
         return None
     
+    def _list_postman_collections(self, postman_dir: Path) -> List[Tuple[FrozenSet[str], Path]]:
+        """
+        List the collections in a directory, reusing the last scan while the directory is unchanged.
+        
+        Args:
+            postman_dir: Postman collections directory
+        
+        Returns:
+            List of (file name tokens, path) tuples in glob order; names are split
+            on anything that isn't a letter or digit (billing-api_v2.json -> billing, api, v2)
+        """
+        try:
+            mtime_ns = postman_dir.stat().st_mtime_ns
+        except OSError:
+            return []
+        listing = self._postman_listing
+        if listing and listing[0] == postman_dir and listing[1] == mtime_ns:
+            return listing[2]
+        files = [(frozenset(_TOKEN_PATTERN.findall(path.stem.lower())), path)
+                 for path in postman_dir.glob("*.json")]
+        self._postman_listing = (postman_dir, mtime_ns, files)
+        return files
+    
     def _execute_postman_collection(self, collection_path: Path) -> Dict[str, Any]:
         """Execute Postman collection using newman."""
         try:
@@ -1021,7 +1377,7 @@ class TestAgent:
             if result.returncode != 0:
                 return {
                     'test_name': f'Postman Collection: {collection_path.name}',
-                    'status': TestStatus.ERROR.value,
+                    'status': _STATUS_ERROR,
                     'error': 'Newman not installed. Install with: npm install -g newman',
                     'timestamp': datetime.now().isoformat()
                 }
@@ -1038,22 +1394,21 @@ class TestAgent:
             
             # Parse results
             if report_file.exists():
-                with open(report_file, 'r') as f:
-                    newman_results = json.load(f)
+                summary = _summarize_newman_report(report_file)
                 
                 return {
                     'test_name': f'Postman Collection: {collection_path.name}',
-                    'status': TestStatus.PASSED.value if newman_results.get('run', {}).get('failures', []) == [] else TestStatus.FAILED.value,
+                    'status': _STATUS_PASSED if summary['failures'] == 0 else _STATUS_FAILED,
                     'collection': str(collection_path),
-                    'total_requests': newman_results.get('run', {}).get('stats', {}).get('requests', {}).get('total', 0),
-                    'passed': newman_results.get('run', {}).get('stats', {}).get('assertions', {}).get('total', 0) - len(newman_results.get('run', {}).get('failures', [])),
-                    'failed': len(newman_results.get('run', {}).get('failures', [])),
+                    'total_requests': summary['requests'],
+                    'passed': summary['assertions'] - summary['failures'],
+                    'failed': summary['failures'],
                     'timestamp': datetime.now().isoformat()
                 }
             
             return {
                 'test_name': f'Postman Collection: {collection_path.name}',
-                'status': TestStatus.ERROR.value,
+                'status': _STATUS_ERROR,
                 'error': 'Failed to generate report',
                 'timestamp': datetime.now().isoformat()
             }
@@ -1061,14 +1416,14 @@ class TestAgent:
         except FileNotFoundError:
             return {
                 'test_name': f'Postman Collection: {collection_path.name}',
-                'status': TestStatus.ERROR.value,
+                'status': _STATUS_ERROR,
                 'error': 'Newman not found. Install with: npm install -g newman',
                 'timestamp': datetime.now().isoformat()
             }
         except Exception as e:
             return {
                 'test_name': f'Postman Collection: {collection_path.name}',
-                'status': TestStatus.ERROR.value,
+                'status': _STATUS_ERROR,
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
@@ -1078,7 +1433,7 @@ class TestAgent:
         return {
             'test_name': 'Generic API Test',
             'description': description,
-            'status': TestStatus.SKIPPED.value,
+            'status': _STATUS_SKIPPED,
             'message': 'Could not extract specific endpoint. Please provide endpoint URL or method.',
             'timestamp': datetime.now().isoformat()
         }
@@ -1101,24 +1456,11 @@ class TestAgent:
             List of test results
         """
         results = []
-        description_lower = task_description.lower()
         
         print("TestAgent: Executing customer-specific tests...")
         
         # Extract operation type
-        operation = None
-        if 'create' in description_lower or 'post' in description_lower:
-            operation = 'create'
-        elif 'edit' in description_lower or 'update' in description_lower or 'put' in description_lower:
-            operation = 'edit'
-        elif 'view' in description_lower or 'get' in description_lower:
-            operation = 'view'
-        elif 'delete' in description_lower:
-            operation = 'delete'
-        elif 'validation' in description_lower:
-            operation = 'validation'
-        elif 'permission' in description_lower:
-            operation = 'permission'
+        operation = self._customer_operation(_description_keywords(task_description))
         
         # Use expert consultation information
         expert_info = {}
@@ -1133,18 +1475,21 @@ class TestAgent:
             if expert_info.get('domain'):
                 print(f"TestAgent: Domain info from expert: {expert_info['domain']}")
         
+        # Expert endpoints by HTTP method, shared by the CRUD tests
+        endpoints = _index_expert_endpoints(expert_info)
+        
         # Execute based on operation type
         if operation == 'create':
-            result = self._test_customer_create(task_description, expert_info)
+            result = self._test_customer_create(task_description, expert_info, endpoints)
             results.append(result)
         elif operation == 'edit':
-            result = self._test_customer_edit(task_description, expert_info)
+            result = self._test_customer_edit(task_description, expert_info, endpoints)
             results.append(result)
         elif operation == 'view':
-            result = self._test_customer_view(task_description, expert_info)
+            result = self._test_customer_view(task_description, expert_info, endpoints)
             results.append(result)
         elif operation == 'delete':
-            result = self._test_customer_delete(task_description, expert_info)
+            result = self._test_customer_delete(task_description, expert_info, endpoints)
             results.append(result)
         elif operation == 'validation':
             validation_results = self._test_customer_validations(task_description, expert_info)
@@ -1153,31 +1498,35 @@ class TestAgent:
             result = self._test_customer_permissions(task_description, expert_info)
             results.append(result)
         else:
-            # Default: test all customer operations
+            # Default: test all customer operations (independent requests, run concurrently)
             print("TestAgent: No specific operation detected, testing customer CRUD operations")
-            results.append(self._test_customer_create(task_description, expert_info))
-            results.append(self._test_customer_edit(task_description, expert_info))
-            results.append(self._test_customer_view(task_description, expert_info))
-            validation_results = self._test_customer_validations(task_description, expert_info)
+            create_result, edit_result, view_result, validation_results, permission_result = self._run_in_parallel([
+                functools.partial(self._test_customer_create, task_description, expert_info, endpoints),
+                functools.partial(self._test_customer_edit, task_description, expert_info, endpoints),
+                functools.partial(self._test_customer_view, task_description, expert_info, endpoints),
+                functools.partial(self._test_customer_validations, task_description, expert_info),
+                functools.partial(self._test_customer_permissions, task_description, expert_info)
+            ])
+            results.extend([create_result, edit_result, view_result])
             results.extend(validation_results)  # Extend because it returns a list
-            results.append(self._test_customer_permissions(task_description, expert_info))
+            results.append(permission_result)
         
         return results
     
-    def _test_customer_create(self, description: str, expert_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_customer_create(
+        self,
+        description: str,
+        expert_info: Dict[str, Any],
+        endpoints: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """Test customer creation with validations and permissions."""
         print("TestAgent: Testing customer create operation...")
         
-        # Build test request based on expert info
-        endpoint = '/api/customer'
+        # Build test request based on expert info (POST endpoint if reported)
+        if endpoints is None:
+            endpoints = _index_expert_endpoints(expert_info)
         method = 'POST'
-        
-        # Get endpoint info from expert if available
-        if expert_info.get('endpoint'):
-            endpoint_info = expert_info['endpoint']
-            if isinstance(endpoint_info, list) and len(endpoint_info) > 0:
-                endpoint = endpoint_info[0].get('path', endpoint)
-                method = endpoint_info[0].get('method', method)
+        endpoint = endpoints.get(method, '/api/customer')
         
         # Build minimal valid customer request (based on CreateCustomerRequest requirements)
         # Using expert info to understand required fields
@@ -1187,14 +1536,7 @@ class TestAgent:
             'foreign': False,
             'marketingConsent': False,
             'customerDetailStatus': 'ACTIVE',
-            'address': {
-                'countryId': 1,  # Should be valid from master data
-                'regionId': 1,
-                'municipalityId': 1,
-                'settlementId': 1,
-                'street': 'Test Street',
-                'streetNumber': '1'
-            }
+            'address': _CREATE_CUSTOMER_ADDRESS
         }
         
         # Execute test
@@ -1205,64 +1547,43 @@ class TestAgent:
         
         return result
     
-    def _test_customer_edit(self, description: str, expert_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_customer_edit(
+        self,
+        description: str,
+        expert_info: Dict[str, Any],
+        endpoints: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """Test customer edit with validations and permissions."""
         print("TestAgent: Testing customer edit operation...")
         
-        endpoint = '/api/customer'
+        # PUT endpoint from expert if available
+        if endpoints is None:
+            endpoints = _index_expert_endpoints(expert_info)
         method = 'PUT'
-        
-        # Get endpoint info from expert if available
-        if expert_info.get('endpoint'):
-            endpoint_info = expert_info['endpoint']
-            if isinstance(endpoint_info, list) and len(endpoint_info) > 0:
-                for ep in endpoint_info:
-                    if ep.get('method', '').upper() == 'PUT':
-                        endpoint = ep.get('path', endpoint)
-                        break
-        
-        # Build edit request (requires customerDetailsVersion and updateExistingVersion)
-        test_data = {
-            'customerDetailsVersion': 1,  # Should be actual version
-            'updateExistingVersion': True,
-            'customerType': 'PRIVATE',
-            'customerIdentifier': 'TEST_ID',
-            'foreign': False,
-            'marketingConsent': False,
-            'customerDetailStatus': 'ACTIVE',
-            'address': {
-                'countryId': 1,
-                'regionId': 1,
-                'municipalityId': 1,
-                'settlementId': 1,
-                'street': 'Updated Street',
-                'streetNumber': '2'
-            }
-        }
+        endpoint = endpoints.get(method, '/api/customer')
         
         # Execute test (will likely fail without valid customer ID, but tests the endpoint)
-        result = self._execute_api_call(endpoint, method, test_data)
+        result = self._execute_api_call(endpoint, method, _EDIT_CUSTOMER_REQUEST)
         result['test_name'] = 'Customer Edit Test'
         result['operation'] = 'edit'
         result['expert_info_used'] = bool(expert_info)
         
         return result
     
-    def _test_customer_view(self, description: str, expert_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_customer_view(
+        self,
+        description: str,
+        expert_info: Dict[str, Any],
+        endpoints: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """Test customer view operation."""
         print("TestAgent: Testing customer view operation...")
         
-        endpoint = '/api/customer'
+        # GET endpoint from expert if available
+        if endpoints is None:
+            endpoints = _index_expert_endpoints(expert_info)
         method = 'GET'
-        
-        # Get endpoint info from expert if available
-        if expert_info.get('endpoint'):
-            endpoint_info = expert_info['endpoint']
-            if isinstance(endpoint_info, list) and len(endpoint_info) > 0:
-                for ep in endpoint_info:
-                    if ep.get('method', '').upper() == 'GET':
-                        endpoint = ep.get('path', endpoint)
-                        break
+        endpoint = endpoints.get(method, '/api/customer')
         
         # Test list endpoint (GET /api/customer)
         result = self._execute_api_call(endpoint, method)
@@ -1272,21 +1593,20 @@ class TestAgent:
         
         return result
     
-    def _test_customer_delete(self, description: str, expert_info: Dict[str, Any]) -> Dict[str, Any]:
+    def _test_customer_delete(
+        self,
+        description: str,
+        expert_info: Dict[str, Any],
+        endpoints: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
         """Test customer delete operation."""
         print("TestAgent: Testing customer delete operation...")
         
-        endpoint = '/api/customer'
+        # DELETE endpoint from expert if available
+        if endpoints is None:
+            endpoints = _index_expert_endpoints(expert_info)
         method = 'DELETE'
-        
-        # Get endpoint info from expert if available
-        if expert_info.get('endpoint'):
-            endpoint_info = expert_info['endpoint']
-            if isinstance(endpoint_info, list) and len(endpoint_info) > 0:
-                for ep in endpoint_info:
-                    if ep.get('method', '').upper() == 'DELETE':
-                        endpoint = ep.get('path', endpoint)
-                        break
+        endpoint = endpoints.get(method, '/api/customer')
         
         # Test delete (will likely fail without valid customer ID)
         result = self._execute_api_call(f"{endpoint}/1", method)  # Assuming ID in path
@@ -1300,38 +1620,8 @@ class TestAgent:
         """Test customer validation rules."""
         print("TestAgent: Testing customer validations...")
         
-        results = []
-        
-        # Test 1: Missing required fields
-        test_data_invalid = {
-            'customerType': 'PRIVATE'
-            # Missing customerIdentifier, foreign, marketingConsent, etc.
-        }
-        result1 = self._execute_api_call('/api/customer', 'POST', test_data_invalid)
-        result1['test_name'] = 'Customer Validation - Missing Required Fields'
-        result1['expected_status'] = '400'  # Bad Request
-        results.append(result1)
-        
-        # Test 2: Invalid customer identifier length
-        test_data_invalid_id = {
-            'customerType': 'PRIVATE',
-            'customerIdentifier': 'X',  # Too short (min 1, max 17)
-            'foreign': False,
-            'marketingConsent': False,
-            'customerDetailStatus': 'ACTIVE',
-            'address': {
-                'countryId': 1,
-                'regionId': 1,
-                'municipalityId': 1,
-                'settlementId': 1,
-                'street': 'Test',
-                'streetNumber': '1'
-            }
-        }
-        result2 = self._execute_api_call('/api/customer', 'POST', test_data_invalid_id)
-        result2['test_name'] = 'Customer Validation - Invalid Identifier Length'
-        result2['expected_status'] = '400'
-        results.append(result2)
+        # Tests 1 and 2 (missing required fields, invalid identifier length) use
+        # fixed request bodies; see the module constants
         
         # Test 3: Invalid customer status (POTENTIAL not allowed)
         test_data_invalid_status = {
@@ -1340,21 +1630,21 @@ class TestAgent:
             'foreign': False,
             'marketingConsent': False,
             'customerDetailStatus': 'POTENTIAL',  # Should be rejected
-            'address': {
-                'countryId': 1,
-                'regionId': 1,
-                'municipalityId': 1,
-                'settlementId': 1,
-                'street': 'Test',
-                'streetNumber': '1'
-            }
+            'address': _VALIDATION_CUSTOMER_ADDRESS
         }
-        result3 = self._execute_api_call('/api/customer', 'POST', test_data_invalid_status)
+        
+        result1, result2, result3 = self._run_in_parallel([
+            functools.partial(self._execute_api_call, '/api/customer', 'POST', test_data)
+            for test_data in (_MISSING_FIELDS_CUSTOMER_REQUEST, _INVALID_ID_CUSTOMER_REQUEST, test_data_invalid_status)
+        ])
+        result1['test_name'] = 'Customer Validation - Missing Required Fields'
+        result1['expected_status'] = '400'  # Bad Request
+        result2['test_name'] = 'Customer Validation - Invalid Identifier Length'
+        result2['expected_status'] = '400'
         result3['test_name'] = 'Customer Validation - Invalid Status (POTENTIAL)'
         result3['expected_status'] = '400'
-        results.append(result3)
         
-        return results
+        return [result1, result2, result3]
     
     def _test_customer_permissions(self, description: str, expert_info: Dict[str, Any]) -> Dict[str, Any]:
         """Test customer permissions."""
@@ -1381,8 +1671,9 @@ class TestAgent:
         base_dir = Path(__file__).parent.parent
         playwright_dir = base_dir / "tests" / "playwright"
         if playwright_dir.exists():
+            keywords = description.lower().split()
             for test_file in playwright_dir.rglob("*.spec.ts"):
-                if any(keyword in test_file.name.lower() for keyword in description.lower().split()):
+                if any(keyword in test_file.name.lower() for keyword in keywords):
                     return test_file
         return None
     
@@ -1401,7 +1692,7 @@ class TestAgent:
             if result.returncode != 0:
                 return {
                     'test_name': f'Playwright Test: {test_path.name}',
-                    'status': TestStatus.ERROR.value,
+                    'status': _STATUS_ERROR,
                     'error': 'Playwright not installed. Install with: npm install -g @playwright/test',
                     'timestamp': datetime.now().isoformat()
                 }
@@ -1420,12 +1711,11 @@ class TestAgent:
             # Parse results
             json_reports = list(report_dir.glob("*.json"))
             if json_reports:
-                with open(json_reports[0], 'r') as f:
-                    playwright_results = json.load(f)
+                playwright_results = _load_json_file(json_reports[0])
                 
                 return {
                     'test_name': f'Playwright Test: {test_path.name}',
-                    'status': TestStatus.PASSED.value if result.returncode == 0 else TestStatus.FAILED.value,
+                    'status': _STATUS_PASSED if result.returncode == 0 else _STATUS_FAILED,
                     'test_file': str(test_path),
                     'exit_code': result.returncode,
                     'results': playwright_results,
@@ -1434,7 +1724,7 @@ class TestAgent:
             
             return {
                 'test_name': f'Playwright Test: {test_path.name}',
-                'status': TestStatus.PASSED.value if result.returncode == 0 else TestStatus.FAILED.value,
+                'status': _STATUS_PASSED if result.returncode == 0 else _STATUS_FAILED,
                 'test_file': str(test_path),
                 'exit_code': result.returncode,
                 'stdout': result.stdout,
@@ -1445,14 +1735,14 @@ class TestAgent:
         except FileNotFoundError:
             return {
                 'test_name': f'Playwright Test: {test_path.name}',
-                'status': TestStatus.ERROR.value,
+                'status': _STATUS_ERROR,
                 'error': 'Playwright not found. Install with: npm install -g @playwright/test',
                 'timestamp': datetime.now().isoformat()
             }
         except Exception as e:
             return {
                 'test_name': f'Playwright Test: {test_path.name}',
-                'status': TestStatus.ERROR.value,
+                'status': _STATUS_ERROR,
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
             }
@@ -1462,7 +1752,7 @@ class TestAgent:
         return {
             'test_name': 'Dynamic UI Test',
             'description': description,
-            'status': TestStatus.SKIPPED.value,
+            'status': _STATUS_SKIPPED,
             'message': 'Dynamic UI test execution requires Playwright test files. Please create test files first.',
             'timestamp': datetime.now().isoformat()
         }
@@ -1472,7 +1762,7 @@ class TestAgent:
         return {
             'test_name': 'Integration Test',
             'description': description,
-            'status': TestStatus.SKIPPED.value,
+            'status': _STATUS_SKIPPED,
             'message': 'Integration test execution - implement based on specific requirements',
             'timestamp': datetime.now().isoformat()
         }
@@ -1482,7 +1772,7 @@ class TestAgent:
         return {
             'test_name': 'E2E Test',
             'description': description,
-            'status': TestStatus.SKIPPED.value,
+            'status': _STATUS_SKIPPED,
             'message': 'E2E test execution - implement based on specific requirements',
             'timestamp': datetime.now().isoformat()
         }
@@ -1490,49 +1780,137 @@ class TestAgent:
     def _determine_overall_status(self, results: List[Dict[str, Any]]) -> str:
         """Determine overall test status from results."""
         if not results:
-            return TestStatus.ERROR.value
+            return _STATUS_ERROR
         
         statuses = [r.get('status') for r in results]
         
-        if TestStatus.FAILED.value in statuses or TestStatus.ERROR.value in statuses:
-            return TestStatus.FAILED.value
-        elif TestStatus.SKIPPED.value in statuses and TestStatus.PASSED.value not in statuses:
-            return TestStatus.SKIPPED.value
+        if _STATUS_FAILED in statuses or _STATUS_ERROR in statuses:
+            return _STATUS_FAILED
+        elif _STATUS_SKIPPED in statuses and _STATUS_PASSED not in statuses:
+            return _STATUS_SKIPPED
         else:
-            return TestStatus.PASSED.value
+            return _STATUS_PASSED
     
     def _generate_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate summary of test results."""
         summary = {
             'total': len(results),
-            'passed': sum(1 for r in results if r.get('status') == TestStatus.PASSED.value),
-            'failed': sum(1 for r in results if r.get('status') == TestStatus.FAILED.value),
-            'skipped': sum(1 for r in results if r.get('status') == TestStatus.SKIPPED.value),
-            'errors': sum(1 for r in results if r.get('status') == TestStatus.ERROR.value)
+            'passed': sum(1 for r in results if r.get('status') == _STATUS_PASSED),
+            'failed': sum(1 for r in results if r.get('status') == _STATUS_FAILED),
+            'skipped': sum(1 for r in results if r.get('status') == _STATUS_SKIPPED),
+            'errors': sum(1 for r in results if r.get('status') == _STATUS_ERROR)
         }
         return summary
     
-    def _save_execution_report(self, execution_record: Dict[str, Any]):
-        """Save execution report to file (legacy JSON format for detailed test results)."""
-        report_file = self.test_results_dir / f"{execution_record['execution_id']}.json"
-        with open(report_file, 'w', encoding='utf-8') as f:
-            json.dump(execution_record, f, indent=2, ensure_ascii=False)
+    def _save_execution_report(self, execution_record: ExecutionRecord):
+        """
+        Queue the execution report for the daily JSONL log (test_results/YYYY-MM-DD.jsonl).
+        
+        One compact JSON line is appended per execution. The legacy per-run
+        TEST_*.json files are only written when 'per_run_reports' is enabled
+        (indented if 'pretty_reports' is also set). The record is serialized
+        here; the file writes happen on the background report writer.
+        """
+        report = execution_record.to_dict()
+        # Day of the run's start (local time, like the execution ID)
+        report_log = self.test_results_dir / f"{execution_record.start_time[:10]}.jsonl"
+        self._enqueue_report_write(report_log, _dump_json(report) + b'\n', append=True)
+        print(f"\nTestAgent: Execution report queued for {report_log}")
         
-        print(f"\nTestAgent: Detailed report saved to {report_file}")
-        print(f"TestAgent: Summary - {execution_record['summary']}")
-        print(f"TestAgent: Overall Status - {execution_record['status']}")
+        if self.config.get('per_run_reports', False):
+            report_file = self.test_results_dir / f"{execution_record.execution_id}.json"
+            payload = _dump_json(report, pretty=self.config.get('pretty_reports', False))
+            self._enqueue_report_write(report_file, payload, append=False)
+            print(f"TestAgent: Detailed report queued for {report_file}")
+        
+        print(f"TestAgent: Summary - {execution_record.summary}")
+        print(f"TestAgent: Overall Status - {execution_record.status}")
         
         # Note: Agent report is saved via reporting_service.save_agent_report()
         # which creates date-based folders with proper naming format
         print("TestAgent: Agent report saved via reporting service\n")
     
+    def _enqueue_report_write(self, path: Path, payload: bytes, append: bool):
+        """Hand a report write to the background writer, starting it if needed."""
+        if self._report_writer is None:
+            with self._report_writer_lock:
+                if self._report_writer is None:
+                    self._report_writer = threading.Thread(
+                        target=self._drain_report_writes,
+                        name="TestAgentReportWriter",
+                        daemon=True
+                    )
+                    self._report_writer.start()
+                    # Don't lose queued reports when the interpreter exits
+                    atexit.register(self.flush_reports, 5.0)
+        self._report_queue.put((path, payload, append))
+    
+    def _drain_report_writes(self):
+        """Background writer loop: batch queued writes and apply them per file."""
+        while True:
+            batch = [self._report_queue.get()]
+            deadline = time.monotonic() + REPORT_BATCH_WINDOW
+            while len(batch) < REPORT_BATCH_SIZE and not isinstance(batch[-1], threading.Event):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._report_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            # Appends to the same log are joined into a single write
+            appends: Dict[Path, List[bytes]] = {}
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    continue
+                path, payload, append = item
+                if append:
+                    appends.setdefault(path, []).append(payload)
+                    continue
+                try:
+                    path.write_bytes(payload)
+                except OSError as e:
+                    print(f"TestAgent: ⚠ Failed to save report {path}: {str(e)}")
+            for path, payloads in appends.items():
+                try:
+                    with open(path, 'ab') as f:
+                        f.write(b''.join(payloads))
+                except OSError as e:
+                    print(f"TestAgent: ⚠ Failed to append reports to {path}: {str(e)}")
+            
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+    
+    def flush_reports(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until all queued execution reports have been written.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely)
+        
+        Returns:
+            True if the queue was flushed, False on timeout
+        """
+        if self._report_writer is None:
+            return True
+        flushed = threading.Event()
+        self._report_queue.put(flushed)
+        return flushed.wait(timeout)
+    
+    def close(self):
+        """Flush queued execution reports and close the shared HTTP session."""
+        self.flush_reports()
+        self._session.close()
+    
     def get_execution_history(self) -> List[Dict[str, Any]]:
         """Get execution history."""
-        return self.execution_history
+        return [record.to_dict() for record in self.execution_history]
     
     def get_last_execution(self) -> Optional[Dict[str, Any]]:
         """Get last execution record."""
-        return self.execution_history[-1] if self.execution_history else None
+        return self.execution_history[-1].to_dict() if self.execution_history else None
     
     def get_consultation_history(self) -> List[Dict[str, Any]]:
         """Get consultation history from agent registry."""
@@ -4,10 +4,12 @@ Services - Supporting services for agents
 This package contains supporting services:
 - ReportingService: Service for agent activity reporting
 - PostmanCollectionGenerator: Service for generating Postman collections
+- CodebaseIndex: Persistent identifier index over the Phoenix codebase
 """
 
 from .reporting_service import get_reporting_service, ReportingService, AgentActivity
 from .postman_collection_generator import get_postman_collection_generator, PostmanCollectionGenerator
+from .codebase_index import get_codebase_index, CodebaseIndex
 
 __all__ = [
     'get_reporting_service',
@@ -15,4 +17,6 @@ __all__ = [
     'AgentActivity',
     'get_postman_collection_generator',
     'PostmanCollectionGenerator',
+    'get_codebase_index',
+    'CodebaseIndex',
 ]
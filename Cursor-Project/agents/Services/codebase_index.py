@@ -0,0 +1,285 @@
+"""
+Codebase Index - Persistent identifier index over the Phoenix codebase
+
+This service keeps an on-disk inverted index (identifier token -> file/line
+locations) so repeated codebase lookups (e.g. one per validated bug) do not
+rescan the source tree every time.
+
+- Index is persisted to .cache/bugfinder_index.json
+- Incremental refresh: only files whose content hash changed are re-tokenized
+  (size/mtime are checked first, so unchanged files are not even read)
+- Identifiers are split on camelCase/snake_case so "refund" matches "processRefund"
+"""
+
+import io
+import os
+import re
+import json
+import hashlib
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+from collections import defaultdict
+
+
+# Default index location (project root/.cache)
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent.parent / ".cache" / "bugfinder_index.json"
+
+# Bump when the on-disk layout changes so stale indexes are rebuilt
+INDEX_VERSION = 2
+
+_IDENTIFIER_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_CAMEL_CASE_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens.
+    
+    Each identifier contributes itself plus its camelCase/snake_case parts.
+    
+    Args:
+        text: Source line or query text
+    
+    Returns:
+        List of tokens (may contain repeats)
+    """
+    tokens = []
+    for identifier in _IDENTIFIER_PATTERN.findall(text):
+        tokens.append(identifier.lower())
+        parts = _CAMEL_CASE_PATTERN.findall(identifier)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts)
+    return tokens
+
+
+def _file_digest(data: bytes) -> str:
+    """Content hash used for change detection."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class CodebaseIndex:
+    """
+    Persistent inverted index over source files.
+    
+    Stores, per file, its size/mtime/content digest and the line numbers of
+    each token. A global token -> files map is derived in memory on load.
+    """
+    
+    def __init__(
+        self,
+        root: Path,
+        index_path: Optional[Path] = None,
+        extensions: Tuple[str, ...] = ('.java',)
+    ):
+        """
+        Initialize codebase index.
+        
+        Args:
+            root: Root directory to index
+            index_path: Where to persist the index (defaults to .cache/bugfinder_index.json)
+            extensions: File extensions to index
+        """
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path else DEFAULT_INDEX_PATH
+        self.extensions = extensions
+        
+        # path -> {'size', 'mtime_ns', 'digest', 'tokens': {token: [line, ...]}}
+        self.files: Dict[str, Dict[str, Any]] = {}
+        # token -> set of paths containing it
+        self.postings: Dict[str, set] = defaultdict(set)
+        
+        # Incremented whenever the indexed content changes; lets callers key
+        # caches of search results on the index state
+        self.generation = 0
+        
+        self._loaded = False
+    
+    def ensure_loaded(self):
+        """Load and refresh the index on first use."""
+        if not self._loaded:
+            self.refresh()
+    
+    def _load(self):
+        """Load persisted index from disk (if present and compatible)."""
+        self._loaded = True
+        if not self.index_path.exists():
+            return
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"CodebaseIndex: [WARNING] Failed to load index, rebuilding: {e}")
+            return
+        if data.get('version') != INDEX_VERSION or data.get('root') != str(self.root):
+            return
+        self.files = data.get('files', {})
+        for path, entry in self.files.items():
+            for token in entry['tokens']:
+                self.postings[token].add(path)
+    
+    def _save(self):
+        """Persist index to disk."""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'root': str(self.root), 'files': self.files}, f)
+        os.replace(tmp_path, self.index_path)
+    
+    def _index_file(self, path: str, data: bytes) -> Dict[str, List[int]]:
+        """Tokenize a file's content into token -> line numbers."""
+        tokens: Dict[str, List[int]] = defaultdict(list)
+        text = data.decode('utf-8', errors='ignore')
+        # Universal newlines, like the text-mode reads in _read_line (str.splitlines()
+        # would also split on \x0c, \x85, \u2028, ... and shift later line numbers)
+        for line_number, line in enumerate(io.StringIO(text, newline=None), 1):
+            for token in set(tokenize(line)):
+                tokens[token].append(line_number)
+        return dict(tokens)
+    
+    def _drop_file(self, path: str):
+        """Remove a file's postings from the in-memory index."""
+        entry = self.files.pop(path, None)
+        if not entry:
+            return
+        for token in entry['tokens']:
+            paths = self.postings.get(token)
+            if paths is not None:
+                paths.discard(path)
+                if not paths:
+                    del self.postings[token]
+    
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the files on disk.
+        
+        Returns:
+            Statistics dictionary: {'added', 'updated', 'removed', 'unchanged'}
+        """
+        if not self._loaded:
+            self._load()
+        
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        seen = set()
+        
+        if self.root.exists():
+            for dirpath, dirnames, filenames in os.walk(self.root):
+                # Skip VCS/build output directories
+                dirnames[:] = [d for d in dirnames if d not in ('.git', 'target', 'build', 'node_modules')]
+                for filename in filenames:
+                    if not filename.endswith(self.extensions):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    seen.add(path)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    
+                    entry = self.files.get(path)
+                    if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+                        stats['unchanged'] += 1
+                        continue
+                    
+                    try:
+                        with open(path, 'rb') as f:
+                            data = f.read()
+                    except OSError:
+                        continue
+                    
+                    digest = _file_digest(data)
+                    if entry and entry['digest'] == digest:
+                        # Touched but not modified - just refresh the stat info
+                        entry['size'] = st.st_size
+                        entry['mtime_ns'] = st.st_mtime_ns
+                        stats['unchanged'] += 1
+                        continue
+                    
+                    stats['updated' if entry else 'added'] += 1
+                    self._drop_file(path)
+                    tokens = self._index_file(path, data)
+                    self.files[path] = {
+                        'size': st.st_size,
+                        'mtime_ns': st.st_mtime_ns,
+                        'digest': digest,
+                        'tokens': tokens
+                    }
+                    for token in tokens:
+                        self.postings[token].add(path)
+        
+        for path in [p for p in self.files if p not in seen]:
+            self._drop_file(path)
+            stats['removed'] += 1
+        
+        changed = stats['added'] or stats['updated'] or stats['removed']
+        if changed:
+            self.generation += 1
+        
+        if changed or not self.index_path.exists():
+            try:
+                self._save()
+            except OSError as e:
+                print(f"CodebaseIndex: [WARNING] Failed to save index: {e}")
+        
+        return stats
+    
+    def search(self, query: str, k: int = 20) -> List[Tuple[str, int, str, float]]:
+        """
+        Search the index for lines matching the query tokens.
+        
+        Files are ranked by the fraction of distinct query tokens they contain;
+        within a file, the line matching the most query tokens is returned.
+        
+        Args:
+            query: Free-text query
+            k: Maximum number of results
+        
+        Returns:
+            List of (path, line, snippet, score) tuples, best first
+        """
+        self.ensure_loaded()
+        
+        query_tokens = set(tokenize(query))
+        if not query_tokens:
+            return []
+        
+        file_hits: Dict[str, int] = defaultdict(int)
+        for token in query_tokens:
+            for path in self.postings.get(token, ()):
+                file_hits[path] += 1
+        
+        ranked = sorted(file_hits.items(), key=lambda item: item[1], reverse=True)[:k]
+        
+        results = []
+        for path, hits in ranked:
+            line_hits: Dict[int, int] = defaultdict(int)
+            tokens = self.files[path]['tokens']
+            for token in query_tokens:
+                for line_number in tokens.get(token, ()):
+                    line_hits[line_number] += 1
+            best_line = max(line_hits.items(), key=lambda item: (item[1], -item[0]))[0]
+            results.append((path, best_line, self._read_line(path, best_line), hits / len(query_tokens)))
+        
+        return results
+    
+    @staticmethod
+    def _read_line(path: str, line_number: int) -> str:
+        """Read a single line from a file for result snippets."""
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                for current, line in enumerate(f, 1):
+                    if current == line_number:
+                        return line.strip()[:200]
+        except OSError:
+            pass
+        return ''
+
+
+# Global index instances (one per root)
+_codebase_indexes: Dict[str, CodebaseIndex] = {}
+
+def get_codebase_index(root: Path, index_path: Optional[Path] = None) -> CodebaseIndex:
+    """Get or create the codebase index for a root directory."""
+    key = str(root)
+    if key not in _codebase_indexes:
+        _codebase_indexes[key] = CodebaseIndex(root, index_path)
+    return _codebase_indexes[key]
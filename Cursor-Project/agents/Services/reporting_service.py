@@ -13,9 +13,17 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from pathlib import Path
 import json
+import time
+import logging
 from collections import defaultdict
 
 
+# Debug trace shared with PhoenixExpert, which attaches its handler when PHOENIX_DEBUG is set.
+# Never propagated to the application's handlers; without PhoenixExpert's handler it is off.
+_DEBUG_LOGGER = logging.getLogger('phoenix_expert.debug')
+_DEBUG_LOGGER.propagate = False
+
+
 class AgentActivity:
     """Represents a single activity performed by an agent."""
     
@@ -65,12 +73,13 @@ class ReportingService:
     - Consultation history
     """
     
-    def __init__(self, reports_dir: Optional[Path] = None):
+    def __init__(self, reports_dir: Optional[Path] = None, enabled: bool = True):
         """
         Initialize reporting service.
         
         Args:
             reports_dir: Directory for storing reports (defaults to reports/ in project root)
+            enabled: Whether agents should record activities and save reports (see is_enabled)
         """
         if reports_dir is None:
             # Default to reports/ folder in project root
@@ -91,6 +100,21 @@ class ReportingService:
         
         # Task execution tracking (agent_name -> list of tasks)
         self.task_executions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        
+        self.enabled = enabled
+        
+        # Whether anything was logged since the last default-named summary report was saved
+        self._summary_dirty = True
+        self._last_summary_path: Optional[Path] = None
+    
+    def is_enabled(self) -> bool:
+        """
+        Check whether agents should report to this service.
+        
+        Agents check this before building report entries, so a disabled service
+        costs them a single call.
+        """
+        return self.enabled
     
     def log_activity(
         self,
@@ -115,6 +139,30 @@ class ReportingService:
             **metadata
         )
         self.activities.append(activity)
+        self._summary_dirty = True
+    
+    def log_activity_batch(self, events: List[Dict[str, Any]]):
+        """
+        Log several agent activities in one call.
+        
+        Args:
+            events: List of activity dictionaries, each with 'agent_name',
+                'activity_type' and 'description'; any other keys are stored as
+                metadata. Events without a 'timestamp' share one batch timestamp.
+        """
+        timestamp = datetime.now().isoformat()
+        activities = []
+        for event in events:
+            event = dict(event)
+            activities.append(AgentActivity(
+                agent_name=event.pop('agent_name'),
+                activity_type=event.pop('activity_type'),
+                description=event.pop('description'),
+                timestamp=event.pop('timestamp', None) or timestamp,
+                **event
+            ))
+        self.activities.extend(activities)
+        self._summary_dirty = True
     
     def log_consultation(
         self,
@@ -200,6 +248,45 @@ class ReportingService:
             **kwargs
         )
     
+    def log_information_sources_batch(self, agent_name: str, sources: List[Dict[str, Any]]):
+        """
+        Log several information sources used by an agent in one call.
+        
+        Args:
+            agent_name: Agent using the sources
+            sources: List of source dictionaries, each with 'source_type',
+                'source_description' and optionally 'information'; any other keys
+                are stored as metadata. All sources share one batch timestamp.
+        """
+        timestamp = datetime.now().isoformat()
+        records = []
+        activities = []
+        for source in sources:
+            metadata = dict(source)
+            source_type = metadata.pop('source_type')
+            source_description = metadata.pop('source_description')
+            information = metadata.pop('information', None)
+            records.append({
+                'timestamp': timestamp,
+                'source_type': source_type,
+                'source_description': source_description,
+                'information_summary': information[:200] if information else None,
+                **metadata
+            })
+            activities.append(AgentActivity(
+                agent_name=agent_name,
+                activity_type="information_source",
+                description=f"Retrieved information from {source_type}: {source_description}",
+                timestamp=timestamp,
+                source_type=source_type,
+                source_description=source_description,
+                **metadata
+            ))
+        
+        self.information_sources[agent_name].extend(records)
+        self.activities.extend(activities)
+        self._summary_dirty = True
+    
     def log_task_execution(
         self,
         agent_name: str,
@@ -431,19 +518,22 @@ class ReportingService:
         Reports are saved in date-based folders (YYYY-MM-DD) with filenames
         containing "Summary", hour, and minutes.
         
+        If nothing was logged since the last default-named summary was saved,
+        that report is still current and is returned without writing a new one.
+        
         Args:
             filename: Optional filename (defaults to Summary_{HHMM}.md)
             
         Returns:
             Path to saved report file
         """
-        # #region agent log
-        import json
-        try:
-            with open(r'c:\Users\N.kevlishvili\Cursor\.cursor\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json.dumps({'id': 'log_report_save_summary', 'timestamp': __import__('time').time() * 1000, 'location': 'reporting_service.py:427', 'message': 'save_summary_report called', 'data': {}, 'sessionId': 'debug-session', 'runId': 'run1', 'hypothesisId': 'B'}) + '\n')
-        except: pass
-        # #endregion
+        if _DEBUG_LOGGER.handlers and _DEBUG_LOGGER.isEnabledFor(logging.DEBUG):
+            _DEBUG_LOGGER.debug(json.dumps({'id': 'log_report_save_summary', 'timestamp': time.time() * 1000, 'location': 'reporting_service.py:427', 'message': 'save_summary_report called', 'data': {}, 'sessionId': 'debug-session', 'runId': 'run1', 'hypothesisId': 'B'}))
+        
+        if (filename is None and not self._summary_dirty and
+                self._last_summary_path is not None and self._last_summary_path.exists()):
+            return self._last_summary_path
+        
         now = datetime.now()
         
         # Create date-based folder (YYYY-MM-DD)
@@ -451,7 +541,8 @@ class ReportingService:
         date_dir = self.reports_dir / date_folder
         date_dir.mkdir(exist_ok=True)
         
-        if filename is None:
+        default_name = filename is None
+        if default_name:
             # Format: Summary_{HHMM}.md (hour and minutes only)
             time_str = now.strftime('%H%M')
             filename = f"Summary_{time_str}.md"
@@ -462,6 +553,11 @@ class ReportingService:
         with open(report_path, 'w', encoding='utf-8') as f:
             f.write(report_content)
         
+        # Only a default-named save is returned for later unchanged saves
+        if default_name:
+            self._summary_dirty = False
+            self._last_summary_path = report_path
+        
         return report_path
     
     def save_all_reports(self) -> List[Path]:
@@ -51,7 +51,8 @@ from .Adapters import (
 # Services
 from .Services import (
     get_reporting_service, ReportingService, AgentActivity,
-    get_postman_collection_generator, PostmanCollectionGenerator
+    get_postman_collection_generator, PostmanCollectionGenerator,
+    get_codebase_index, CodebaseIndex
 )
 
 # Utils (import separately to avoid circular imports)
@@ -90,5 +91,7 @@ __all__ = [
     'get_reporting_service',
     'ReportingService',
     'AgentActivity',
+    'get_codebase_index',
+    'CodebaseIndex',
 ]
 